@@ -0,0 +1,167 @@
+import json
+import time
+import queue
+import threading
+import importlib
+import urllib.request
+import urllib.error
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import matplotlib
+
+matplotlib.use('Agg')  # Nothing is ever shown; the daemon may run without a display
+
+from helpers.utilities import (load_weather_data, load_rollup, logo_image, report_date, report_date_range,
+                               report_arguments)
+from helpers.database import ROLLUPS
+
+
+# Report daemon: keeps the interpreter, pandas, matplotlib, the analytics modules & the loaded database
+# warm, and renders reports asked for over HTTP on localhost, so a scheduled job only pays render time.
+#
+#   python3 daemon.py                                           start it (port 8765)
+#   python3 daemon.py --submit pressure --location Home --start 01-01-2025 --end 31-03-2025
+#   curl -d '{"analytic": "rain", "location": "Home", "start": "01-01-2025", "end": "31-03-2025"}' \
+#        http://127.0.0.1:8765/report
+#
+# POST /report answers once the report is saved: {"paths": [...], "seconds": ...} or {"error": ...}.
+# GET /status lists the analytics and how many requests are waiting. Requests are queued and rendered one
+# at a time by a single worker thread, as pyplot is not thread-safe.
+
+HOST = '127.0.0.1'
+PORT = 8765
+
+ANALYTICS = ['report_full', 'snapshot', 'humidity', 'humidityrain', 'indoor_humidity', 'indoor_humidtemp',
+             'indoor_temp', 'pressure', 'rain', 'solaruv', 'storms', 'temperature', 'winddistribution',
+             'windgust', 'windspeed', 'windspeedgust']
+
+jobs = queue.Queue()
+
+
+def warm_up():
+    # Everything a report needs before its first chart: modules, database, rollups & the page logo
+    for name in ANALYTICS:
+        importlib.import_module(f'modules.{name}')
+    load_weather_data()
+    logo_image()
+    for name in ROLLUPS:
+        load_rollup(name)
+
+
+def render(request):
+    # request: analytic, location, start & end (DD-MM-YYYY), optional out & raster. Returns the saved files.
+    name = request.get('analytic')
+    if name not in ANALYTICS:
+        raise ValueError(f"Unknown analytic: {name}")
+    if not all(request.get(field) for field in ('location', 'start', 'end')):
+        raise ValueError("location, start & end (DD-MM-YYYY) are required")
+
+    start_date, end_date = report_date(request.get('start')), report_date(request.get('end'))
+    start_date, end_date = report_date_range(load_weather_data(), start_date, end_date)
+    module = importlib.import_module(f'modules.{name}')
+    out = request.get('out')
+    raster = request.get('raster')  # true/false, or left out for the analytic's RASTER_LAYERS setting
+
+    if name == 'report_full':
+        # Pages are drawn here in turn; forking a worker pool from this threaded server is not safe
+        return module.generate_full_report(request['location'], start_date, end_date, out, workers=1, raster=raster)
+    if name == 'snapshot':
+        return [str(module.generate_snapshot(request['location'], start_date.date(), end_date.date(), out))]
+    return [module.generate_report(request['location'], start_date, end_date, out, raster=raster)]
+
+
+def worker():
+    while True:
+        request, done, result = jobs.get()
+        started = time.perf_counter()
+        try:
+            result['paths'] = render(request)
+            result['seconds'] = round(time.perf_counter() - started, 2)
+        except (Exception, SystemExit) as e:
+            result['error'] = str(e).removeprefix('Error: ')
+        done.set()
+
+
+class ReportHandler(BaseHTTPRequestHandler):
+
+    def reply(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path != '/status':
+            return self.reply(404, {'error': 'Not found'})
+        self.reply(200, {'analytics': ANALYTICS, 'queued': jobs.qsize()})
+
+    def do_POST(self):
+        if self.path != '/report':
+            return self.reply(404, {'error': 'Not found'})
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        except ValueError:
+            return self.reply(400, {'error': 'Request body must be JSON'})
+
+        done, result = threading.Event(), {}
+        jobs.put((request, done, result))
+        done.wait()
+        self.reply(400 if 'error' in result else 200, result)
+
+    def log_message(self, format, *args):
+        print(f" {self.address_string()} {format % args}")
+
+
+def serve(port=PORT):
+    print("\n\033[1;93m Loading the database & analytics...\033[0m")
+    warm_up()
+    threading.Thread(target=worker, daemon=True).start()
+
+    server = ThreadingHTTPServer((HOST, port), ReportHandler)
+    print(f"\033[1;92m Report daemon listening on http://{HOST}:{port}\033[0m\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\033[1;92m Stopping the report daemon...\033[0m\n")
+    finally:
+        server.server_close()
+
+
+def submit(request, port=PORT):
+    # Client side: sends one request and waits for the daemon's answer
+    http_request = urllib.request.Request(f'http://{HOST}:{port}/report', data=json.dumps(request).encode(),
+                                          headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(http_request) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return json.loads(e.read())
+
+
+def main():
+    parser = report_arguments('Report daemon: serve reports from a warm process, or submit one to it.')
+    parser.add_argument('--port', type=int, default=PORT, help=f'localhost port (default: {PORT})')
+    parser.add_argument('--submit', metavar='ANALYTIC', choices=ANALYTICS,
+                        help='ask a running daemon for this report instead of starting one')
+    args = parser.parse_args()
+
+    if not args.submit:
+        serve(args.port)
+        return
+
+    if args.location is None or args.start is None or args.end is None:
+        parser.error('--submit needs --location, --start and --end')
+
+    result = submit({'analytic': args.submit, 'location': args.location, 'start': args.start.strftime('%d-%m-%Y'),
+                     'end': args.end.strftime('%d-%m-%Y'), 'out': args.out, 'raster': args.raster}, args.port)
+    if 'error' in result:
+        print(f"\n\033[1;91m Error: {result['error']}\033[0m\n")
+        raise SystemExit(1)
+    for path in result['paths']:
+        print(f"    Saved: {path}")
+    print(f"    Rendered in {result['seconds']}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,542 @@
+import io
+import os
+import re
+import json
+import heapq
+import codecs
+import hashlib
+import warnings
+import numpy as np
+import pandas as pd
+
+
+# Paths are mapped from the root folder (menu.py)
+COMPILED_CSV = 'database/compiled/ingest.csv'
+CACHE_DIR = 'database/compiled/cache/'
+DATE_COLUMN = 'Date (Europe/London)'
+
+CACHE_VERSION = 5
+MANIFEST = 'manifest.json'
+
+# Byte order marks, longest first so UTF-32 LE is not mistaken for UTF-16 LE
+BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'), (codecs.BOM_UTF32_BE, 'utf-32'), (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# The 19 columns exported by the station (see helpers/debug.py)
+STATION_COLUMNS = [
+    "Date (Europe/London)", "Inside temperature (°C)", "Temperature (°C)", "Wind chill (°C)",
+    "Inside dew point (°C)", "Dew point (°C)", "Inside heat index (°C)", "Heat index (°C)",
+    "Inside humidity (%)", "Humidity (%)", "Gust of wind (mph)", "Average wind speed (mph)",
+    "Average wind direction (°)", "Atmospheric pressure (mbar)", "Rain (mm)",
+    "Evapotranspiration (mm)", "Rain rate (mm/h)", "Solar radiation (W/m²)", "UV index"
+]
+STATION_DTYPES = {col: 'float64' for col in STATION_COLUMNS}
+STATION_DTYPES[DATE_COLUMN] = 'str'
+
+# In-memory & cached dtypes once parsed. The station exports at most one decimal place and
+# seven significant digits, which float32 holds exactly as displayed at half the size of float64.
+# Bounded metrics stay float (not scaled integers) so gaps remain NaN and the cache can be
+# memory-mapped as is, without a decode copy on every load.
+STATION_SCHEMA = {
+    DATE_COLUMN: 'datetime64[s]',
+    # Temperatures, -60…60 °C in 0.1 steps
+    "Inside temperature (°C)": 'float32', "Temperature (°C)": 'float32', "Wind chill (°C)": 'float32',
+    "Inside dew point (°C)": 'float32', "Dew point (°C)": 'float32', "Inside heat index (°C)": 'float32',
+    "Heat index (°C)": 'float32',
+    # Bounded: 0…100 %, 0…360 °, UV 0…16 in 0.1 steps
+    "Inside humidity (%)": 'float32', "Humidity (%)": 'float32', "Average wind direction (°)": 'float32',
+    "UV index": 'float32',
+    # Wind, pressure & solar
+    "Gust of wind (mph)": 'float32', "Average wind speed (mph)": 'float32',
+    "Atmospheric pressure (mbar)": 'float32', "Solar radiation (W/m²)": 'float32',
+    # Rain in 0.1 mm steps, evapotranspiration in 0.01 mm steps
+    "Rain (mm)": 'float32', "Evapotranspiration (mm)": 'float32', "Rain rate (mm/h)": 'float32',
+}
+# Any column the station adds in future is stored like the other metrics
+EXTRA_COLUMN_DTYPE = 'float32'
+
+# Data lines start with a fixed-width timestamp, which also sorts chronologically as text
+TIMESTAMP_LINE = re.compile(r'\d{4}-\d\d-\d\d \d\d:\d\d:\d\d;')
+
+# Lines handed to the C engine at once when the whole-file fast path fails
+FALLBACK_CHUNK_LINES = 100_000
+
+# Station logging interval, i.e. the resolution of the raw rows
+RAW_PERIOD = '5min'
+
+# Pre-aggregated tables stored with the raw columns, finest to coarsest: name → (period, stats per metric).
+# Together with the raw rows they form the resolution pyramid charts pick from; hourly & daily also
+# serve the summaries so they keep every statistic, the others only the mean & min/max envelope.
+ROLLUP_STATS = ['min', 'max', 'mean', 'sum', 'last']
+ENVELOPE_STATS = ['min', 'max', 'mean']
+ROLLUPS = {
+    '15min': ('15min', ENVELOPE_STATS),
+    'hourly': ('1h', ROLLUP_STATS),
+    '6hourly': ('6h', ENVELOPE_STATS),
+    'daily': ('1D', ROLLUP_STATS),
+}
+SAMPLES = ('samples', 'count')
+
+
+def source_signature(csv_path: str = COMPILED_CSV) -> dict:
+    # Size & mtime catch a recompile, the head/tail digest catches a copy that preserved both
+    stat = os.stat(csv_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(csv_path, 'rb') as f:
+        digest.update(f.read(65_536))
+        if stat.st_size > 65_536:
+            f.seek(max(stat.st_size - 65_536, 65_536))
+            digest.update(f.read())
+
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'digest': digest.hexdigest()}
+
+
+def write_cache(data: pd.DataFrame, csv_path: str = COMPILED_CSV, cache_dir: str = CACHE_DIR) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Drop the manifest first so a half-written bundle is never mistaken for a valid one
+    manifest_path = os.path.join(cache_dir, MANIFEST)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    columns = []
+    for i, col in enumerate(data.columns):
+        filename = f'c{i:02d}.npy'
+        _save_array(cache_dir, filename, data[col].to_numpy())
+        columns.append({'name': col, 'file': filename})
+
+    # Rollup pyramid, so long reports read a few thousand rows instead of every sample
+    rollups = {}
+    for name, (period, stats) in ROLLUPS.items():
+        rollup = build_rollup(data, period, stats)
+        _save_array(cache_dir, f'{name}_index.npy', rollup.index.to_numpy())
+        rollup_columns = []
+        for i, (col, stat) in enumerate(rollup.columns):
+            filename = f'{name}_{i:03d}.npy'
+            _save_array(cache_dir, filename, rollup[(col, stat)].to_numpy())
+            rollup_columns.append({'name': col, 'stat': stat, 'file': filename})
+        rollups[name] = {'rows': len(rollup), 'index': f'{name}_index.npy', 'columns': rollup_columns}
+
+    manifest = {
+        'version': CACHE_VERSION,
+        'source': source_signature(csv_path),
+        'rows': len(data),
+        'columns': columns,
+        'rollups': rollups,
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+
+def _save_array(cache_dir: str, filename: str, array: np.ndarray) -> None:
+    # One contiguous .npy array per column so readers can memory-map exactly the columns they touch.
+    # Each file is replaced rather than rewritten in place: a process still mapping the old bundle
+    # keeps its pages instead of crashing on a truncated file.
+    path = os.path.join(cache_dir, filename)
+    with open(path + '.tmp', 'wb') as f:
+        np.save(f, np.ascontiguousarray(array))
+    os.replace(path + '.tmp', path)
+
+
+def extend_cache(stored: pd.DataFrame, new_rows: pd.DataFrame, manifest: dict, csv_path: str = COMPILED_CSV,
+                 cache_dir: str = CACHE_DIR) -> None:
+    # Adds rows newer than everything in the bundle without rewriting it: each column file grows by the new
+    # rows, and each rollup is rebuilt from the first period the new rows touch (the stored rows of that
+    # period come from stored, the mapped bundle). manifest is the bundle's, read before ingest.csv grew.
+    first_new = new_rows[DATE_COLUMN].iloc[0]
+    if list(new_rows.columns) != [column['name'] for column in manifest['columns']]:
+        raise ValueError("New exports have different columns")
+    if first_new <= stored[DATE_COLUMN].iloc[-1]:
+        raise ValueError("New rows must start after the cached ones")
+
+    # Stored rows of every period still open at the first new row; daily is the coarsest period
+    periods = [pd.Timestamp(first_new).floor(period) for period, _stats in ROLLUPS.values()]
+    recent = stored.iloc[stored[DATE_COLUMN].searchsorted(min(periods)):].copy()
+    recent = pd.concat([recent, new_rows], ignore_index=True)
+
+    manifest_path = os.path.join(cache_dir, MANIFEST)
+    os.remove(manifest_path)
+
+    for column in manifest['columns']:
+        _extend_array(cache_dir, column['file'], new_rows[column['name']].to_numpy(), manifest['rows'])
+    manifest['rows'] += len(new_rows)
+
+    for (name, (period, stats)), start in zip(ROLLUPS.items(), periods):
+        entry = manifest['rollups'][name]
+        rollup = build_rollup(recent.iloc[recent[DATE_COLUMN].searchsorted(start):], period, stats)
+        index = np.load(os.path.join(cache_dir, entry['index']), mmap_mode='r')
+        position = int(np.searchsorted(index, start.to_datetime64().astype(index.dtype)))
+        del index
+        if [(column['name'], column['stat']) for column in entry['columns']] != list(rollup.columns):
+            raise ValueError(f"Rollup {name} has different columns")
+
+        _extend_array(cache_dir, entry['index'], rollup.index.to_numpy(), position)
+        for column in entry['columns']:
+            _extend_array(cache_dir, column['file'], rollup[(column['name'], column['stat'])].to_numpy(), position)
+        entry['rows'] = position + len(rollup)
+
+    manifest['source'] = source_signature(csv_path)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+
+def _extend_array(cache_dir: str, filename: str, array: np.ndarray, start: int) -> None:
+    # Writes array over rows start… of a cached column, in place, and records the new length in the header.
+    # numpy pads .npy headers so the length can grow without moving the data; rows before start are never
+    # touched, so a process still mapping them keeps valid pages.
+    npy = np.lib.format
+    path = os.path.join(cache_dir, filename)
+    with open(path, 'r+b') as f:
+        version = npy.read_magic(f)
+        read_header, write_header = ((npy.read_array_header_1_0, npy.write_array_header_1_0) if version == (1, 0)
+                                     else (npy.read_array_header_2_0, npy.write_array_header_2_0))
+        shape, fortran_order, dtype = read_header(f)
+        offset = f.tell()
+        if len(shape) != 1 or fortran_order or start > shape[0] or start + len(array) < shape[0]:
+            raise ValueError(f"{filename} cannot be extended in place")
+
+        header = io.BytesIO()
+        write_header(header, {'descr': npy.dtype_to_descr(dtype), 'fortran_order': False,
+                              'shape': (start + len(array),)})
+        if header.tell() != offset:
+            raise ValueError(f"{filename} header has no room to grow")
+
+        f.seek(offset + start * dtype.itemsize)
+        f.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+        f.seek(0)
+        f.write(header.getvalue())
+
+
+def build_rollup(data: pd.DataFrame, period: str, stats: list[str] = ROLLUP_STATS) -> pd.DataFrame:
+    # The given stats of every metric per period plus the raw sample count, indexed by period start.
+    # Periods without samples are left out, exactly as grouping the raw rows would.
+    starts = data[DATE_COLUMN].dt.floor(period).to_numpy()
+    grouped = data.drop(columns=DATE_COLUMN).groupby(starts, sort=False)
+
+    rollup = grouped.agg(stats).astype('float32')
+    rollup[SAMPLES] = grouped.size().astype('int32')
+    rollup.index = pd.DatetimeIndex(rollup.index, name=DATE_COLUMN)
+    return rollup
+
+
+def memory_report(data: pd.DataFrame) -> tuple[int, int]:
+    # Bytes the frame actually holds, and what the same rows took with float64 metrics
+    used = int(data.memory_usage(index=False, deep=True).sum())
+    wide = len(data) * 8 * len(data.columns)
+    return used, wide
+
+
+def read_manifest(csv_path: str = COMPILED_CSV, cache_dir: str = CACHE_DIR) -> dict | None:
+    # Returns the manifest only while it still describes the current compiled database
+    try:
+        with open(os.path.join(cache_dir, MANIFEST), encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != CACHE_VERSION:
+            return None
+        if manifest.get('source') != source_signature(csv_path):
+            return None
+    except (OSError, ValueError):
+        return None
+
+    return manifest
+
+
+def read_cache(csv_path: str = COMPILED_CSV, cache_dir: str = CACHE_DIR, mmap: bool = True) -> pd.DataFrame | None:
+    manifest = read_manifest(csv_path, cache_dir)
+    if manifest is None:
+        return None
+
+    # Read-only memory maps by default: pages are loaded on first touch and shared through the OS
+    # cache by every process reading the bundle, so RSS follows the columns a chart actually uses
+    try:
+        columns = {}
+        for column in manifest['columns']:
+            array = np.load(os.path.join(cache_dir, column['file']), mmap_mode='r' if mmap else None)
+            if len(array) != manifest['rows']:
+                return None
+            columns[column['name']] = pd.Series(array, copy=False)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    # copy=False keeps every column backed by its map instead of consolidating into one new block
+    return pd.DataFrame(columns, copy=False)
+
+
+def read_rollup(name: str, csv_path: str = COMPILED_CSV, cache_dir: str = CACHE_DIR,
+                mmap: bool = True) -> pd.DataFrame | None:
+    # One of ROLLUPS, columns keyed (metric, stat) and indexed by period start
+    manifest = read_manifest(csv_path, cache_dir)
+    if manifest is None or name not in manifest.get('rollups', {}):
+        return None
+
+    mmap_mode = 'r' if mmap else None
+    try:
+        entry = manifest['rollups'][name]
+        index = np.load(os.path.join(cache_dir, entry['index']), mmap_mode=mmap_mode)
+        columns = {}
+        for column in entry['columns']:
+            array = np.load(os.path.join(cache_dir, column['file']), mmap_mode=mmap_mode)
+            if len(array) != entry['rows']:
+                return None
+            columns[(column['name'], column['stat'])] = pd.Series(array, copy=False)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    rollup = pd.DataFrame(columns, copy=False)
+    rollup.index = pd.DatetimeIndex(index, name=DATE_COLUMN)
+    return rollup
+
+
+def _read_csv_c(source, encoding: str | None = None) -> tuple[pd.DataFrame, int]:
+    # C engine with explicit dtypes; lines with too many fields are skipped and counted
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', pd.errors.ParserWarning)
+        data = pd.read_csv(source, sep=';', encoding=encoding, skip_blank_lines=True, header=0,
+                           na_values=['', ' '], thousands=',', dtype=STATION_DTYPES, on_bad_lines='warn',
+                           engine='c')
+    skipped = sum(str(w.message).count('Skipping line') for w in caught)
+    return data, skipped
+
+
+def _read_csv_python(source) -> tuple[pd.DataFrame, int]:
+    # Tolerant Python engine, only used on line ranges the C engine rejected
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', pd.errors.ParserWarning)
+        data = pd.read_csv(source, sep=';', skip_blank_lines=True, header=0, na_values=['', ' '],
+                           on_bad_lines='warn', engine='python')
+    skipped = sum(str(w.message).count('Skipping line') for w in caught)
+
+    data.columns = [col.strip() for col in data.columns]
+    for col, dtype in STATION_DTYPES.items():
+        if col in data.columns and dtype == 'float64':
+            data[col] = pd.to_numeric(data[col].astype(str).str.replace(',', '', regex=True),
+                                      errors='coerce').astype(dtype)
+    return data, skipped
+
+
+def _read_csv_by_ranges(csv_path: str, encoding: str) -> tuple[pd.DataFrame, int, int]:
+    with open(csv_path, 'r', encoding=encoding, newline='') as f:
+        header = f.readline()
+        lines = f.readlines()
+
+    frames = []
+    skipped = 0
+    slow_lines = 0
+    for start in range(0, len(lines), FALLBACK_CHUNK_LINES):
+        chunk = header + ''.join(lines[start:start + FALLBACK_CHUNK_LINES])
+        try:
+            frame, chunk_skipped = _read_csv_c(io.StringIO(chunk))
+        except (ValueError, pd.errors.ParserError):
+            frame, chunk_skipped = _read_csv_python(io.StringIO(chunk))
+            slow_lines += len(lines[start:start + FALLBACK_CHUNK_LINES])
+        frames.append(frame)
+        skipped += chunk_skipped
+
+    return pd.concat(frames, ignore_index=True), skipped, slow_lines
+
+
+def parse_timestamps(values) -> np.ndarray:
+    # 'YYYY-MM-DD HH:MM:SS' → datetime64[s] in one vectorised pass over the fixed-width bytes.
+    # Anything not in that exact layout (or an impossible date) becomes NaT, as errors='coerce' did.
+    cells = pd.Series(values).fillna('')
+    try:
+        text = np.asarray(cells, dtype='S20')  # One spare byte to spot over-long cells
+    except UnicodeEncodeError:
+        return pd.to_datetime(cells.astype(str).str.strip(), format='%Y-%m-%d %H:%M:%S',
+                              errors='coerce').to_numpy('datetime64[s]')
+
+    chars = text.view(np.uint8).reshape(len(text), 20)
+    digits = chars[:, [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]] - np.uint8(ord('0'))  # wraps if not a digit
+    valid = (digits <= 9).all(axis=1) & (chars[:, 19] == 0)
+    valid &= (chars[:, 4] == ord('-')) & (chars[:, 7] == ord('-')) & (chars[:, 10] == ord(' '))
+    valid &= (chars[:, 13] == ord(':')) & (chars[:, 16] == ord(':'))
+
+    fields = digits.astype(np.int64) @ np.array([
+        # year    month  day    hour   minute second (time fields come out in seconds)
+        [1000, 0, 0, 0, 0, 0], [100, 0, 0, 0, 0, 0], [10, 0, 0, 0, 0, 0], [1, 0, 0, 0, 0, 0],
+        [0, 10, 0, 0, 0, 0], [0, 1, 0, 0, 0, 0], [0, 0, 10, 0, 0, 0], [0, 0, 1, 0, 0, 0],
+        [0, 0, 0, 3600 * 10, 0, 0], [0, 0, 0, 3600, 0, 0], [0, 0, 0, 0, 600, 0], [0, 0, 0, 0, 60, 0],
+        [0, 0, 0, 0, 0, 10], [0, 0, 0, 0, 0, 1],
+    ], dtype=np.int64)
+    year, month, day, hours, minutes, seconds = fields.T
+    valid &= (month >= 1) & (month <= 12) & (day >= 1) & (hours < 24 * 3600) & (minutes < 3600) & (seconds < 60)
+
+    year, month, day = np.where(valid, year, 1970), np.where(valid, month, 1), np.where(valid, day, 1)
+    months = (year - 1970).astype('datetime64[Y]').astype('datetime64[M]') + (month - 1).astype('timedelta64[M]')
+    days = months.astype('datetime64[D]') + (day - 1).astype('timedelta64[D]')
+    valid &= days.astype('datetime64[M]') == months  # Rejects 31 April and friends
+
+    stamps = days.astype('datetime64[s]') + (hours + minutes + seconds).astype('timedelta64[s]')
+    stamps[~valid] = np.datetime64('NaT')
+
+    # Padded cells are rare; only those rows go through the string-based parser
+    padded = ~valid & (chars[:, 0] != 0)
+    if padded.any():
+        retry = cells[padded].astype(str).str.strip()
+        stamps[padded] = pd.to_datetime(retry, format='%Y-%m-%d %H:%M:%S', errors='coerce').to_numpy('datetime64[s]')
+    return stamps
+
+
+def metadata_path(csv_path: str = COMPILED_CSV) -> str:
+    # Sidecar next to the compiled database, e.g. database/compiled/ingest.json
+    return os.path.splitext(csv_path)[0] + '.json'
+
+
+def read_metadata(csv_path: str = COMPILED_CSV) -> dict:
+    try:
+        with open(metadata_path(csv_path), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_metadata(csv_path: str = COMPILED_CSV, **fields) -> None:
+    metadata = read_metadata(csv_path)
+    metadata.update(fields)
+    with open(metadata_path(csv_path), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=1)
+
+
+def probe_encoding(file_path: str) -> str:
+    with open(file_path, 'rb') as f:
+        sample = f.read(4096)
+
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    # Station exports are UTF-16 without a BOM: mostly-ASCII text leaves every other byte NUL
+    if sample[1::2].count(0) > len(sample) // 4:
+        return 'utf-16le'
+    if sample[0::2].count(0) > len(sample) // 4:
+        return 'utf-16be'
+
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        if e.start >= len(sample) - 3:  # Sample cut through a multi-byte character
+            return 'utf-8'
+
+    # Last resort for unknown 8-bit exports, imported here to keep it off the normal load path
+    import chardet
+    return chardet.detect(sample)['encoding'] or 'latin-1'
+
+
+def record_encoding(csv_path: str, encoding: str) -> None:
+    stat = os.stat(csv_path)
+    write_metadata(csv_path, encoding=encoding, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def compiled_encoding(csv_path: str = COMPILED_CSV) -> str:
+    # Encoding recorded at compile time, re-probed only if ingest.csv was replaced by hand
+    metadata = read_metadata(csv_path)
+    stat = os.stat(csv_path)
+    if (metadata.get('encoding') and metadata.get('size') == stat.st_size
+            and metadata.get('mtime_ns') == stat.st_mtime_ns):
+        return metadata['encoding']
+
+    encoding = probe_encoding(csv_path)
+    record_encoding(csv_path, encoding)
+    return encoding
+
+
+def fingerprint_original(file_path: str) -> dict:
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'digest': digest.hexdigest()}
+
+
+def pending_originals(csv_files: list[str], ingested: dict) -> tuple[dict, list[str], list[str]]:
+    # Splits the original exports into new files and previously compiled files that changed or vanished.
+    # Unchanged size & mtime skip re-hashing; otherwise the content hash decides (a touched copy is not stale).
+    fingerprints = {}
+    new_files = []
+    for file in csv_files:
+        name = os.path.basename(file)
+        known = ingested.get(name)
+        stat = os.stat(file)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+            fingerprints[name] = known
+            continue
+
+        fingerprints[name] = fingerprint_original(file)
+        if known is None:
+            new_files.append(file)
+
+    stale = [name for name, known in ingested.items()
+             if name not in fingerprints or fingerprints[name]['digest'] != known['digest']]
+    return fingerprints, new_files, stale
+
+
+def _data_lines(file_path: str, encoding: str, counts: dict):
+    # Data lines of one export (header skipped), newline-terminated; undated lines are counted and dropped
+    with open(file_path, 'r', encoding=encoding) as f:
+        f.readline()
+        for line in f:
+            if not TIMESTAMP_LINE.match(line):
+                counts['undated'] += line.strip() != ''
+                continue
+            yield line if line.endswith('\n') else line + '\n'
+
+
+def export_time_range(file_path: str, encoding: str) -> tuple[bool, str | None, str | None]:
+    # One cheap pass over the timestamps: (chronologically ordered?, first, last)
+    ordered, first, last = True, None, None
+    for line in _data_lines(file_path, encoding, {'undated': 0}):
+        key = line[:19]
+        if last is not None and key < last:
+            ordered = False
+        first = key if first is None or key < first else first
+        last = key if last is None or key > last else last
+    return ordered, first, last
+
+
+def _sorted_lines(file_path: str, encoding: str, counts: dict):
+    ordered, _first, _last = export_time_range(file_path, encoding)
+    if ordered:
+        yield from _data_lines(file_path, encoding, counts)
+    else:
+        # Rare out-of-order export: only this one file is sorted in memory
+        yield from sorted(_data_lines(file_path, encoding, counts), key=lambda line: line[:19])
+
+
+def merge_exports(sources: list[tuple[str, str]], outfile, after: str | None = None) -> dict:
+    # Streaming k-way merge of individually sorted exports into one chronological, duplicate-free stream.
+    # On equal timestamps the earlier source wins, so already-compiled rows are never replaced.
+    # Lines stamped at or before after (the last compiled timestamp) are counted as duplicates & skipped.
+    counts = {'written': 0, 'duplicates': 0, 'undated': 0}
+    streams = [_sorted_lines(path, encoding, counts) for path, encoding in sources]
+
+    last_key = after
+    for line in heapq.merge(*streams, key=lambda line: line[:19]):
+        key = line[:19]
+        if last_key is not None and key <= last_key:
+            counts['duplicates'] += 1
+            continue
+        outfile.write(line)
+        counts['written'] += 1
+        last_key = key
+
+    return counts
+
+
+def read_compiled_csv(csv_path: str = COMPILED_CSV, encoding: str | None = None) -> pd.DataFrame:
+    encoding = encoding or compiled_encoding(csv_path)
+
+    try:
+        data, skipped = _read_csv_c(csv_path, encoding)
+    except (ValueError, pd.errors.ParserError):
+        # Only the line ranges the C engine cannot parse go through the Python engine
+        data, skipped, slow_lines = _read_csv_by_ranges(csv_path, encoding)
+        print(f" {slow_lines} lines needed the slow parser")
+
+    if skipped:
+        print(f" Skipped {skipped} malformed lines")
+    return data
@@ -0,0 +1,88 @@
+import numpy as np
+
+
+# Point-budget reduction of a chart line. Both methods return sorted indices into the series, so the
+# caller keeps x & y (and any other column) aligned. NaN gaps are kept wherever a whole bucket is NaN.
+
+
+def _bucket_bounds(n: int, buckets: int) -> np.ndarray:
+    # Start of every bucket plus the end of the series, buckets as equal in size as possible
+    return np.linspace(0, n, buckets + 1).astype(np.int64)
+
+
+def minmax_indices(y: np.ndarray, budget: int) -> np.ndarray:
+    # Lowest & highest sample of each of budget // 2 buckets. With one bucket per output pixel this
+    # draws exactly what the full series would: every pixel column still spans its true min → max.
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    buckets = max(budget // 2, 1)
+    if n <= budget:
+        return np.arange(n)
+
+    bounds = _bucket_bounds(n, buckets)
+    size = int(np.max(np.diff(bounds)))
+    # Pad every bucket to the same width so argmin/argmax run as one vectorised pass
+    grid = np.full((buckets, size), np.nan)
+    offsets = np.arange(size)
+    rows = bounds[:-1, None] + offsets
+    valid = rows < bounds[1:, None]
+    grid[valid] = y[rows[valid]]
+
+    lows = np.argmin(np.where(np.isnan(grid), np.inf, grid), axis=1)
+    highs = np.argmax(np.where(np.isnan(grid), -np.inf, grid), axis=1)
+    indices = np.concatenate([bounds[:-1] + lows, bounds[:-1] + highs])
+    return np.unique(indices)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, budget: int) -> np.ndarray:
+    # Largest-Triangle-Three-Buckets: first & last point kept, then from each bucket the point making
+    # the largest triangle with the previous pick and the next bucket's average. Follows the visual
+    # shape closely with one point per bucket; the overall min & max are added back so the extremes
+    # always match the full chart.
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= budget or budget < 3:
+        return np.arange(n)
+
+    bounds = _bucket_bounds(n - 2, budget - 2) + 1
+    picks = np.empty(budget, dtype=np.int64)
+    picks[0], picks[-1] = 0, n - 1
+
+    previous = 0
+    for i in range(budget - 2):
+        start, end = bounds[i], bounds[i + 1]
+        following = slice(bounds[i + 1], bounds[i + 2]) if i < budget - 3 else slice(n - 1, n)
+        avg_x = np.mean(x[following])
+        avg_y = np.nanmean(y[following]) if np.any(~np.isnan(y[following])) else y[previous]
+
+        areas = np.abs((x[previous] - avg_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (avg_y - y[previous]))
+        if np.all(np.isnan(areas)):
+            picks[i + 1] = start
+        else:
+            picks[i + 1] = start + int(np.nanargmax(areas))
+            previous = picks[i + 1]
+
+    if np.any(~np.isnan(y)):
+        picks = np.concatenate([picks, [np.nanargmin(y), np.nanargmax(y)]])
+    return np.unique(picks)
+
+
+def decimate_indices(x: np.ndarray, y: np.ndarray, budget: int, method: str = 'minmax') -> np.ndarray:
+    if method == 'minmax':
+        return minmax_indices(y, budget)
+    if method == 'lttb':
+        return lttb_indices(x, y, budget)
+    raise ValueError(f"Unknown decimation method: {method}")
+
+
+def envelope_buckets(lower: np.ndarray, upper: np.ndarray, budget: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Start index, lowest lower & highest upper per bucket, so a shaded band keeps its outer edge
+    n = len(lower)
+    if n <= budget:
+        return np.arange(n), np.asarray(lower), np.asarray(upper)
+
+    starts = _bucket_bounds(n, budget)[:-1]
+    return (starts, np.fmin.reduceat(np.asarray(lower, dtype=np.float64), starts),
+            np.fmax.reduceat(np.asarray(upper, dtype=np.float64), starts))
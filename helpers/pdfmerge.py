@@ -0,0 +1,144 @@
+import re
+import hashlib
+
+
+# Joins single-chart PDFs written by matplotlib's PdfPages into one document, page order preserved.
+# Matplotlib writes plain PDF 1.4 (classic xref table, no object streams), so every object can be
+# copied byte for byte with its object numbers changed; stream data is never touched.
+# Each page file embeds its own copy of the logo & of the glyphs it draws. Objects whose content and
+# referenced objects are identical (glyph procedures, images, font descriptors...) are written once.
+
+REFERENCE = re.compile(rb'\b(\d+) 0 R\b')
+OBJECT_HEADER = re.compile(rb'^(\d+) 0 obj')
+TRAILER = re.compile(rb'trailer\s*<<(.*?)>>\s*startxref\s*(\d+)', re.S)
+
+
+def _read_objects(pdf: bytes) -> tuple[dict[int, bytes], dict[str, int]]:
+    # Object number → raw 'N 0 obj ... endobj' bytes, plus the trailer's /Root & /Info numbers
+    trailer, xref_offset = TRAILER.findall(pdf)[-1]
+    entries = pdf[int(xref_offset):].split(b'trailer', 1)[0].split(b'\n')
+    first, count = (int(value) for value in entries[1].split())
+
+    offsets = {}
+    for number, entry in enumerate(entries[2:2 + count], start=first):
+        fields = entry.split()
+        if len(fields) == 3 and fields[2] == b'n':
+            offsets[number] = int(fields[0])
+
+    # Each object runs up to the next one (or the xref table), so nothing inside streams is parsed
+    ends = sorted(offsets.values()) + [int(xref_offset)]
+    following = dict(zip(ends, ends[1:]))
+    objects = {number: pdf[offset:following[offset]] for number, offset in offsets.items()}
+
+    roots = {key.decode(): int(value) for key, value in re.findall(rb'/(Root|Info) (\d+) 0 R', trailer)}
+    return objects, roots
+
+
+def _references(obj: bytes) -> list[int]:
+    # Object numbers referenced from the dictionary part (stream data may contain anything)
+    return [int(number) for number in REFERENCE.findall(obj.partition(b'\nstream\n')[0])]
+
+
+def _renumber(obj: bytes, number: int, numbers: dict[int, int]) -> bytes:
+    # The object as number, its references mapped through numbers (old → new)
+    head, marker, stream = obj.partition(b'\nstream\n')
+    head = OBJECT_HEADER.sub(b'%d 0 obj' % number, head)
+    head = REFERENCE.sub(lambda m: b'%d 0 R' % numbers[int(m.group(1))], head)
+    return head + marker + stream
+
+
+def _content_keys(objects: dict[int, bytes], unique: set[int]) -> dict[int, bytes | None]:
+    # Object number → digest of its content with references replaced by the digests of their targets,
+    # so equal keys mean equal objects in any file. None for objects in unique, or that reach one or a
+    # reference cycle: those are always written as they are.
+    keys = {}
+
+    def key(number, visiting):
+        if number not in keys:
+            if number in unique or number in visiting:
+                return None
+            visiting.add(number)
+            targets = {target: key(target, visiting) for target in _references(objects[number])}
+            visiting.discard(number)
+            if None in targets.values():
+                keys[number] = None
+            else:
+                head, marker, stream = OBJECT_HEADER.sub(b'', objects[number]).partition(b'\nstream\n')
+                head = REFERENCE.sub(lambda m: b'<%s>' % targets[int(m.group(1))], head)
+                keys[number] = hashlib.blake2b(head + marker + stream, digest_size=16).hexdigest().encode()
+        return keys[number]
+
+    for number in objects:
+        key(number, set())
+    return keys
+
+
+def merge_pdfs(paths: list[str], out_path: str) -> int:
+    # Returns the number of pages written
+    catalog, pages_tree = 1, 2
+    body = []
+    kids = []
+    info = None
+    shared = {}  # content key → object number in the merged file
+    next_number = pages_tree + 1
+
+    for path in paths:
+        with open(path, 'rb') as f:
+            objects, roots = _read_objects(f.read())
+
+        old_tree = int(re.search(rb'/Pages (\d+) 0 R', objects[roots['Root']]).group(1))
+        page_numbers = [int(n) for n in REFERENCE.findall(
+            re.search(rb'/Kids \[(.*?)\]', objects[old_tree], re.S).group(1))]
+
+        # Only what the pages (and the first file's /Info) use is copied; the old catalog & page tree
+        # are replaced by the merged ones, so each page's /Parent is pointed at the new tree
+        numbers = {old_tree: pages_tree}
+        keys = _content_keys(objects, {old_tree, *page_numbers})
+        copied = []
+        pending = list(reversed(page_numbers))
+        if info is None and 'Info' in roots:
+            pending.append(roots['Info'])
+        while pending:
+            number = pending.pop()
+            if number in numbers:
+                continue
+            if keys.get(number) in shared:
+                numbers[number] = shared[keys[number]]
+                continue
+            numbers[number] = next_number
+            if keys.get(number) is not None:
+                shared[keys[number]] = next_number
+            next_number += 1
+            copied.append(number)
+            pending += reversed(_references(objects[number]))
+
+        body += [_renumber(objects[number], numbers[number], numbers) for number in copied]
+        kids += [numbers[number] for number in page_numbers]
+        if info is None and 'Info' in roots:
+            info = numbers[roots['Info']]
+
+    kid_refs = b' '.join(b'%d 0 R' % kid for kid in kids)
+    head = [
+        b'%PDF-1.4\n%\xac\xdc \xab\xba\n',
+        b'%d 0 obj\n<< /Type /Catalog /Pages %d 0 R >>\nendobj\n' % (catalog, pages_tree),
+        b'%d 0 obj\n<< /Type /Pages /Kids [ %s ] /Count %d >>\nendobj\n' % (pages_tree, kid_refs, len(kids)),
+    ]
+
+    # Offsets for the xref table; object 0 is the usual head of the free list
+    offsets = {}
+    position = len(head[0])
+    for obj in head[1:] + body:
+        number = int(OBJECT_HEADER.match(obj).group(1))
+        offsets[number] = position
+        position += len(obj)
+
+    xref = [b'xref\n0 %d\n' % next_number, b'0000000000 65535 f \n']
+    xref += [b'%010d 00000 n \n' % offsets[number] for number in range(1, next_number)]
+    trailer = b'trailer\n<< /Size %d /Root %d 0 R' % (next_number, catalog)
+    if info is not None:
+        trailer += b' /Info %d 0 R' % info
+    trailer += b' >>\nstartxref\n%d\n%%%%EOF\n' % position
+
+    with open(out_path, 'wb') as f:
+        f.writelines(head + body + xref + [trailer])
+    return len(kids)
@@ -0,0 +1,74 @@
+import io
+import os
+import time
+import argparse
+import tempfile
+import importlib
+import contextlib
+import pandas as pd
+import matplotlib
+
+matplotlib.use('Agg')
+
+from helpers.utilities import (load_weather_data, load_rollups, logo_image, report_date, report_date_range,
+                               RASTER_LAYERS, RASTER_DPI)
+
+
+# Vector vs rasterised data layers, run from the package root: python3 -m helpers.raster_benchmark
+# Saves every chart for the window in both modes and prints each file's size & render time, so an
+# analytic is only switched on in RASTER_LAYERS (helpers/utilities.py) where its report gets smaller.
+
+
+def render(module, data, rollups, start_date, end_date, path, raster):
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # Per-chart prints
+        module.generate_report('Benchmark', start_date, end_date, path, data, raster, rollups)
+    return os.path.getsize(path) / 1024, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='File size & render time of every chart, vector vs raster.')
+    parser.add_argument('--start', type=report_date, metavar='DD-MM-YYYY', help='first day (default: a year back)')
+    parser.add_argument('--end', type=report_date, metavar='DD-MM-YYYY', help='last day (default: last day held)')
+    parser.add_argument('--analytic', action='append', choices=list(RASTER_LAYERS),
+                        help='only this analytic (repeatable)')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists('menu.py'):
+        raise SystemExit("Run from the package root: python3 -m helpers.raster_benchmark")
+
+    # Load everything first so the first chart's time is render time only
+    data = load_weather_data()
+    rollups = load_rollups()
+    logo_image()
+
+    end_date = args.end or data['Date (Europe/London)'].max().normalize()
+    start_date = args.start or max(end_date - pd.DateOffset(years=1), data['Date (Europe/London)'].min().normalize())
+    start_date, end_date = report_date_range(data, start_date, end_date)
+
+    print(f"\n Vector vs raster ({RASTER_DPI} dpi) data layers, "
+          f"{start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}:\n")
+    print(f"    {'Analytic':<18}{'Vector':>17}{'Raster':>17}   Smaller   RASTER_LAYERS")
+
+    totals = [0, 0, 0, 0]
+    with tempfile.TemporaryDirectory() as out_dir:
+        for name in args.analytic or RASTER_LAYERS:
+            module = importlib.import_module(f'modules.{name}')
+            chart_data = module.load_chart_data()
+            vector = render(module, chart_data, rollups, start_date, end_date,
+                            os.path.join(out_dir, f'{name}_vector.pdf'), False)
+            raster = render(module, chart_data, rollups, start_date, end_date,
+                            os.path.join(out_dir, f'{name}_raster.pdf'), True)
+            totals = [total + value for total, value in zip(totals, vector + raster)]
+
+            smaller = 'raster' if raster[0] < vector[0] else 'vector'
+            colour = '92' if (smaller == 'raster') == RASTER_LAYERS[name] else '93'
+            print(f"    {name:<18}{vector[0]:>7.0f} KB {vector[1]:>5.2f}s{raster[0]:>7.0f} KB {raster[1]:>5.2f}s"
+                  f"   \033[1;{colour}m{smaller:<9}\033[0m {RASTER_LAYERS[name]}")
+
+    print(f"    {'Total':<18}{totals[0]:>7.0f} KB {totals[1]:>5.2f}s{totals[2]:>7.0f} KB {totals[3]:>5.2f}s\n")
+    print(" Yellow: RASTER_LAYERS picks the larger file for this window.\n")
+
+
+if __name__ == '__main__':
+    main()
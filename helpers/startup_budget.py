@@ -0,0 +1,82 @@
+import os
+import re
+import sys
+import time
+import subprocess
+
+
+# Startup benchmark for menu.py, run from the package root: python3 -m helpers.startup_budget
+# Starts the menu under 'python -X importtime', answers its first prompt with 'e' (exit) and fails when
+# the time to get there or the import time regresses past the budget, or when a library that should
+# only load with an analytic is imported at start.
+
+STARTUP_BUDGET_MS = 250  # interpreter start → first prompt → exit, best of RUNS
+IMPORT_BUDGET_MS = 60  # cumulative import time of everything menu.py pulls in at start
+DEFERRED = ['pandas', 'numpy', 'matplotlib', 'chardet']
+RUNS = 5
+
+MENU_PROMPT = 'Select a feature'  # Printed by menu() once the menu is up
+
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)')
+
+
+def measure_startup():
+    env = dict(os.environ, TERM='dumb')  # clear_console() stays quick & quiet
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', 'menu.py'], input='e\n', capture_output=True,
+                            text=True, env=env)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    # A menu that fails to start exits quickly too, so a fast run only counts if the prompt was shown
+    if result.returncode != 0 or MENU_PROMPT not in result.stdout:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'no error output'
+        raise SystemExit(f"\n\033[1;91m Error: menu.py did not reach its prompt (exit code {result.returncode}): "
+                         f"{error}\033[0m\n")
+
+    # module → cumulative µs; top-level imports are the ones indented by a single space
+    imports = {}
+    top_level_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            imports[match.group(4)] = int(match.group(2))
+            if len(match.group(3)) == 1:
+                top_level_us += int(match.group(2))
+    return elapsed_ms, top_level_us / 1000, imports
+
+
+def main():
+    if not os.path.exists('menu.py'):
+        raise SystemExit("Run from the package root: python3 -m helpers.startup_budget")
+
+    runs = [measure_startup() for _ in range(RUNS)]
+    startup_ms = min(run[0] for run in runs)
+    import_ms = min(run[1] for run in runs)
+    imports = runs[0][2]
+
+    print("\n Menu startup:")
+    print(f"    Time to first prompt: {startup_ms:.0f} ms (budget {STARTUP_BUDGET_MS} ms)")
+    print(f"    Import time:          {import_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    print("    Slowest imports:")
+    for name, us in sorted(imports.items(), key=lambda item: item[1], reverse=True)[:5]:
+        print(f"        {us / 1000:7.1f} ms  {name}")
+
+    failures = []
+    deferred = sorted({name.split('.')[0] for name in imports} & set(DEFERRED))
+    if deferred:
+        failures.append(f"Imported at start but only needed by analytics: {', '.join(deferred)}")
+    if startup_ms > STARTUP_BUDGET_MS:
+        failures.append(f"Time to first prompt {startup_ms:.0f} ms is over the {STARTUP_BUDGET_MS} ms budget")
+    if import_ms > IMPORT_BUDGET_MS:
+        failures.append(f"Import time {import_ms:.1f} ms is over the {IMPORT_BUDGET_MS} ms budget")
+
+    if failures:
+        for failure in failures:
+            print(f"\n\033[1;91m Error: {failure}\033[0m")
+        print()
+        raise SystemExit(1)
+    print("\n\033[1;92m Menu startup is within budget.\033[0m\n")
+
+
+if __name__ == '__main__':
+    main()
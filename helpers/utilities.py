@@ -1,17 +1,48 @@
+import numpy as np
 import pandas as pd
 import os
 import glob
 import os
-import chardet
-import matplotlib.dates as mdates
+import argparse
+from helpers.database import (read_cache, write_cache, read_compiled_csv, probe_encoding, record_encoding,
+                              parse_timestamps, read_metadata, write_metadata, pending_originals,
+                              merge_exports, memory_report, STATION_SCHEMA, EXTRA_COLUMN_DTYPE, read_rollup,
+                              build_rollup, read_manifest, extend_cache, ROLLUPS, COMPILED_CSV)
+from helpers.decimation import decimate_indices, envelope_buckets
+
+
+# Plotting width of a chart in pixels: A4 landscape (11.69 in) less the 10% side margins, saved at 300 dpi
+CHART_PIXELS = int(11.69 * 0.8 * 300)
+# Points handed to matplotlib per line (two per pixel: each pixel's min & max) and how they are chosen
+PLOT_POINTS = 2 * CHART_PIXELS
+DECIMATION = 'minmax'
+# Logo drawn on every page, and where (left, bottom, width, height as fractions of the figure)
+LOGO_PATH = 'helpers/img/logo.jpg'
+LOGO_RECT = [0.47, 0.08, 0.07, 0.07]
+# Date axis markers by chart span: (longest span in days, major ticks, label format, minor ticks, axis label).
+# Ticks are (unit, step); every tier keeps the tick & grid-line count per chart in the low hundreds.
+DATE_MARKERS = [
+    (186, ('month', 1), '%b %y', ('day', 1), 'Daily date markers'),
+    (731, ('month', 1), '%b %y', ('week', 1), 'Weekly date markers'),
+    (2192, ('month', 3), '%b %y', ('month', 1), 'Monthly date markers'),
+    (None, ('year', 1), '%Y', ('month', 3), 'Quarterly date markers'),
+]
+# Charts are saved as vector PDFs. An analytic set True here draws its dense data layers (lines, bars & fills
+# of at least RASTER_MIN_POINTS vertices) as images at RASTER_DPI instead, while titles, axes, ticks, legends
+# & text stay vector; --raster / --vector override it for one run. Decimated lines are smaller as vectors,
+# so all are off: compare both with 'python3 -m helpers.raster_benchmark' before switching one on.
+RASTER_DPI = 300
+RASTER_MIN_POINTS = 500
+RASTER_LAYERS = {'humidity': False, 'humidityrain': False, 'indoor_humidity': False, 'indoor_humidtemp': False,
+                 'indoor_temp': False, 'pressure': False, 'rain': False, 'solaruv': False, 'storms': False,
+                 'temperature': False, 'winddistribution': False, 'windgust': False, 'windspeed': False,
+                 'windspeedgust': False}
 
 
 def view_database_dates():
     try:
-        data = load_data()
+        data = load_weather_data()
         date_col = 'Date (Europe/London)'
-        data[date_col] = pd.to_datetime(data[date_col].astype(str).str.strip(),
-                                        format='%Y-%m-%d %H:%M:%S', errors='coerce')
         min_date, max_date = data[date_col].min(), data[date_col].max()
         print(f"\033[1;97m Existing database: {min_date.strftime('%B %Y')} - {max_date.strftime('%B %Y')}\033[0m")
 
@@ -20,48 +51,108 @@ def view_database_dates():
     input("  Press 'enter' to continue...")
 
 
-def merge_csv_files():
+def merge_csv_files(full_rebuild=False):
     try:
         input_folder = 'database/original/' # mapped from the root folder (menu.py)
         output_file: str = "database/compiled/ingest.csv" # mapped from the root folder (menu.py)
 
-        csv_files = glob.glob(os.path.join(input_folder, "*.csv"))
+        csv_files = sorted(glob.glob(os.path.join(input_folder, "*.csv")))
 
         if not csv_files:
             print("\n No CSV files found in the folder.")
             return
 
-        with open(output_file, 'w', encoding='utf-16le', newline='') as outfile:
-            header_written = False
+        # Only exports that were never compiled are added; anything else forces a full rebuild
+        ingested = read_metadata(output_file).get('originals', {})
+        fingerprints, new_files, stale = pending_originals(csv_files, ingested)
+        incremental = ingested and not stale and not full_rebuild
+        # Maps this process still holds from earlier reports are let go, as the cache is rewritten below.
+        # The stored data is mapped: adding exports only reads its timestamps & its last day of rows.
+        release_loaded_data()
+        cached = read_cache(output_file) if incremental else None
+        manifest = read_manifest(output_file) if cached is not None else None
+        if cached is not None and cached.empty:
+            cached = None
+
+        if cached is not None and not new_files:
+            print("\n\033[1;92m Database is already up to date.\033[0m")
+            input(" Press 'enter' to continue...")
+            return
 
-            for file in csv_files:
-                with open(file, 'r', encoding='utf-16le') as infile:
-                    header = infile.readline()
+        if stale and not full_rebuild:
+            print(f"\n {len(stale)} previously compiled file(s) changed or were removed, rebuilding...")
 
-                    if not header_written:
-                        outfile.write(header)  # Write header from the first file
-                        header_written = True
+        compile_files = csv_files if cached is None else new_files
+        # BOM-aware, so a leading BOM never ends up inside the first column name
+        sources = [(file, probe_encoding(file)) for file in compile_files]
 
-                    for line in infile:
-                        outfile.write(line)  # Append data
+        # New exports normally overlap the stored data: their rows up to the last stored timestamp are
+        # already there and are dropped, and only later rows are appended to ingest.csv & the cache.
+        # Only an export that fills a gap inside the stored range is merged into a fresh copy.
+        date_col = 'Date (Europe/London)'
+        append = False
+        if cached is not None:
+            incoming = prepare_data(pd.concat([read_compiled_csv(file, encoding) for file, encoding in sources],
+                                              ignore_index=True))
+            stored_dates = cached[date_col].to_numpy()
+            earlier = incoming[date_col].to_numpy()
+            earlier = earlier[earlier <= stored_dates[-1]]
+            positions = np.minimum(np.searchsorted(stored_dates, earlier), len(stored_dates) - 1)
+            append = list(incoming.columns) == list(cached.columns) and bool((stored_dates[positions] == earlier).all())
+            new_rows = incoming.iloc[len(earlier):].reset_index(drop=True)
+            if not append:
+                # Merged & rewritten in full: read into memory, as the mapped files are replaced
+                cached = read_cache(output_file, mmap=False)
+                sources.insert(0, (output_file, 'utf-16le'))
+
+        target = output_file if append else output_file + '.tmp'
+        with open(target, 'a' if append else 'w', encoding='utf-16le', newline='') as outfile:
+            if not append:
+                with open(sources[0][0], 'r', encoding=sources[0][1]) as infile:
+                    outfile.write(infile.readline().rstrip('\n') + '\n')  # Write header from the first file
+
+            # Chronological, duplicate-free k-way merge of the (individually sorted) exports
+            after = f"{cached[date_col].iloc[-1]:%Y-%m-%d %H:%M:%S}" if append else None
+            counts = merge_exports(sources, outfile, after)
+        if target != output_file:
+            os.replace(target, output_file)
+
+        # Record the encoding once so no loader has to detect it again
+        record_encoding(output_file, 'utf-16le')
 
         file_size = os.path.getsize(output_file) / (1024 * 1024)  # Convert bytes to MB
 
-        print(f"\n\033[1;92m Compiled {len(csv_files)} files.\033[0m")
+        if cached is None:
+            print(f"\n\033[1;92m Compiled {len(compile_files)} files.\033[0m")
+        elif append:
+            print(f"\n\033[1;92m Appended {len(new_rows)} new readings from {len(compile_files)} new files.\033[0m")
+        else:
+            print(f"\n\033[1;92m Merged {len(compile_files)} new files.\033[0m")
         print(f"\033[1;97m Working copy for analytics: {output_file} (Size: {file_size:.2f} MB)\033[0m")
+        if counts['duplicates'] or counts['undated']:
+            print(f"\033[1;97m Dropped {counts['duplicates']} duplicate timestamps & {counts['undated']} undated lines\033[0m")
 
         try:
-            file_path = 'database/compiled/ingest.csv'
-            with open(file_path, 'rb') as f:
-                detected_encoding = chardet.detect(f.read(5000))['encoding']
-            data = pd.read_csv(
-                file_path, sep=';', encoding=detected_encoding, skip_blank_lines=True,
-                header=0, na_values=['', ' '], on_bad_lines='skip', engine='python'
-            )
-            date_col = 'Date (Europe/London)'
-            data[date_col] = pd.to_datetime(data[date_col].astype(str).str.strip(),
-                                            format='%Y-%m-%d %H:%M:%S', errors='coerce')
-            min_date, max_date = data[date_col].min(), data[date_col].max()
+            # Parse only what was written and store the result as a typed columnar cache for every loader
+            if cached is None:
+                write_cache(prepare_data(read_compiled_csv(output_file)), output_file)
+            elif append:
+                try:
+                    if len(new_rows):  # Otherwise ingest.csv is unchanged & the cache still matches it
+                        extend_cache(cached, new_rows, manifest, output_file)
+                except ValueError:
+                    # A bundle that cannot grow in place is rewritten from the (already updated) database
+                    write_cache(prepare_data(read_compiled_csv(output_file)), output_file)
+            else:
+                write_cache(sort_chronologically(pd.concat([cached, incoming], ignore_index=True)), output_file)
+            write_metadata(output_file, originals=fingerprints)
+
+            data = read_cache(output_file)
+            used, wide = memory_report(data)
+            print(f"\033[1;97m In memory: {used / (1024 * 1024):.2f} MB"
+                  f" (float64 schema: {wide / (1024 * 1024):.2f} MB)\033[0m")
+
+            min_date, max_date = data[date_col].iloc[0], data[date_col].iloc[-1]
             print(f"\033[1;97m New database: {min_date.strftime('%B %Y')} - {max_date.strftime('%B %Y')}\033[0m")
         except Exception as e:
             print(f"\n\033[1;91m Error reading database: {e}\033[0m\n")
@@ -114,22 +205,311 @@ def get_user_date_range(data):
             print(f"{kbi}")
 
 
-def load_data():
-    while True:
-        try:
-            with open('database/compiled/ingest.csv', 'rb') as f:
-                raw_data = f.read(5000)  # Read the first 5000 bytes
-                result = chardet.detect(raw_data)  # Detect encoding
-                detected_encoding = result['encoding']
+def report_date(text):
+    try:
+        return pd.to_datetime(text, format='%d-%m-%Y')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{text}', use DD-MM-YYYY")
+
+
+def report_arguments(description, out_help='file to save the report as (default: analytics/)', raster=True):
+    # Command line shared by every analytic. Anything left out is asked for as before, so with all
+    # four given a report runs without a terminal (cron, benchmarks).
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--location', help='weather station location used in chart titles')
+    parser.add_argument('--start', type=report_date, metavar='DD-MM-YYYY', help='first day of the report')
+    parser.add_argument('--end', type=report_date, metavar='DD-MM-YYYY', help='last day of the report')
+    parser.add_argument('--out', metavar='PATH', help=out_help)
+    if raster:
+        layers = parser.add_mutually_exclusive_group()
+        layers.add_argument('--raster', action='store_const', const=True, dest='raster',
+                            help=f'draw the data layers as {RASTER_DPI} dpi images (default: RASTER_LAYERS)')
+        layers.add_argument('--vector', action='store_const', const=False, dest='raster',
+                            help='keep the data layers as vector paths')
+    return parser
+
+
+def report_date_range(data, start_date=None, end_date=None):
+    # Dates from the command line get the same checks as typed ones; asked for if either is missing
+    if start_date is None or end_date is None:
+        return get_user_date_range(data)
+
+    error = None
+    if start_date > end_date:
+        error = "Start date must be before end date."
+    elif start_date < data['Date (Europe/London)'].min() or end_date > data['Date (Europe/London)'].max():
+        error = "Date range is outside available data."
+    if error:
+        print(f"\n\033[1;91m Error: {error}\033[0m\n")
+        raise SystemExit(f"Error: {error}")
+    return start_date, end_date
 
-                loaded_data = pd.read_csv('database/compiled/ingest.csv', sep=';', encoding=detected_encoding,
-                                   skip_blank_lines=True, header=0, na_values=['', ' '], on_bad_lines='skip',
-                                   engine='python')
-                return loaded_data
 
-        except Exception as e:
-            print(f"\n\033[1;91m Error: {e}\033[0m\n")
-            raise SystemExit(f"Error: {e}")
+def load_data():
+    # Kept for the standalone modules, now served from the typed cache like every other loader
+    return load_weather_data()
+
+
+def prepare_data(data):
+    data.columns = [col.strip() for col in data.columns]
+    date_col = 'Date (Europe/London)'
+    expected_columns = {date_col}
+    if not expected_columns.issubset(data.columns):
+        raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
+
+    # Parse dates once, straight to datetime64
+    if not pd.api.types.is_datetime64_any_dtype(data[date_col]):
+        data[date_col] = parse_timestamps(data[date_col])
+
+    # The C parser already delivers the station metrics as floats (thousands separators included);
+    # only unexpected extra columns can still arrive as text and need coercing here.
+    # Every metric is then narrowed to its compact storage dtype (see STATION_SCHEMA).
+    for col in data.columns:
+        if col == date_col:
+            continue
+        if not pd.api.types.is_numeric_dtype(data[col]):
+            data[col] = pd.to_numeric(data[col].astype(str).str.replace(',', '', regex=True), errors='coerce')
+        dtype = STATION_SCHEMA.get(col, EXTRA_COLUMN_DTYPE)
+        if data[col].dtype != dtype:
+            data[col] = data[col].astype(dtype)
+
+    return sort_chronologically(data)
+
+
+def sort_chronologically(data):
+    # Undated rows dropped, oldest first, and only the first copy of a repeated timestamp kept.
+    # The compiled database is already in this order, so normally only the O(n) checks run.
+    date_col = 'Date (Europe/London)'
+    data = data.dropna(subset=[date_col])
+    if not data[date_col].is_monotonic_increasing:
+        data = data.sort_values(by=date_col, kind='stable')
+
+    stamps = data[date_col].to_numpy()
+    first_copy = np.ones(len(stamps), dtype=bool)
+    first_copy[1:] = stamps[1:] != stamps[:-1]
+    return data[first_copy].reset_index(drop=True)
+
+
+def slice_date_range(data, start, end, whole_days=False):
+    # Rows from start to end (inclusive) of a chronologically sorted frame, located by binary search
+    # on the timestamps (the DatetimeIndex if there is one, otherwise the date column).
+    # The result is a positional slice - a view of the data rather than a masked copy.
+    # whole_days=True widens the window to the full calendar days of start & end.
+    stamps = data.index if isinstance(data.index, pd.DatetimeIndex) else data['Date (Europe/London)']
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    if whole_days:
+        start, end = start.normalize(), end.normalize() + pd.Timedelta(days=1)
+
+    first = stamps.searchsorted(start, side='left')
+    last = stamps.searchsorted(end, side='left' if whole_days else 'right')
+    return data.iloc[first:last]
+
+
+# Database already loaded by this process, with the ingest.csv size & mtime it was read against
+loaded_data = {}
+
+
+def load_weather_data():
+    # Parsed, typed & sorted copy of the compiled database, shared by every chart of a report.
+    # Served from the columnar cache while it matches ingest.csv (read-only memory maps shared with
+    # any other report process), otherwise re-parsed and re-cached. A long-lived process (the menu)
+    # keeps it loaded until ingest.csv changes; callers get a shallow copy they are free to modify.
+    try:
+        stat = os.stat(COMPILED_CSV)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if loaded_data.get('stamp') != stamp:
+            data = read_cache()
+            if data is None:
+                data = prepare_data(read_compiled_csv())
+                write_cache(data)
+            loaded_data.update(stamp=stamp, data=data)
+        return loaded_data['data'].copy(deep=False)
+
+    except Exception as e:
+        print(f"\n\033[1;91m Error: {e}\033[0m\n")
+        raise SystemExit(f"Error: {e}")
+
+
+# Rollups already opened by this process, with the ingest.csv size & mtime they were read against
+loaded_rollups = {}
+
+
+def load_rollup(name):
+    # Pre-aggregated 'hourly' or 'daily' table written alongside the cache, indexed by period start.
+    # Rebuilt from the raw rows if the compiled cache predates it. Kept for the life of the process
+    # while ingest.csv is unchanged, so every chart and every report window of a run share one copy.
+    stat = os.stat(COMPILED_CSV)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    if name in loaded_rollups and loaded_rollups[name][0] == stamp:
+        return loaded_rollups[name][1]
+
+    rollup = read_rollup(name)
+    if rollup is None:
+        rollup = build_rollup(load_weather_data(), *ROLLUPS[name])
+    loaded_rollups[name] = (stamp, rollup)
+    return rollup
+
+
+def release_loaded_data():
+    # Forget the database & rollups kept by load_weather_data() / load_rollup(), closing their maps
+    loaded_data.clear()
+    loaded_rollups.clear()
+
+
+def select_resolution(start_date, end_date, pixels=CHART_PIXELS):
+    # Coarsest level of the pyramid (raw rows, then ROLLUPS from fine to coarse) that still puts at
+    # least one point on every output pixel between start_date and end_date
+    span = pd.Timestamp(end_date) - pd.Timestamp(start_date)
+    resolution = 'raw'
+    for name, (period, _stats) in ROLLUPS.items():
+        if span / pd.Timedelta(period) >= pixels:
+            resolution = name
+    return resolution
+
+
+def load_rollups():
+    # Every rollup of the loaded database (see load_rollup), to hand to chart_series() & daily_rain()
+    # along with load_weather_data()
+    return {name: load_rollup(name) for name in ROLLUPS}
+
+
+def chart_series(data, columns, start_date, end_date, rollups=None, pixels=CHART_PIXELS):
+    # What a chart plots for start_date → end_date, read at select_resolution(). Each column holds
+    # the period mean, with '<column> min' & '<column> max' as its envelope so peaks survive
+    # (for raw rows the envelope is the value itself). The level used is kept in attrs['resolution'].
+    # Whole days: the rows & periods of end_date are included. rollups are those of data (load_rollups()
+    # for the loaded database); without them the level is aggregated from data's own rows in the window.
+    date_col = 'Date (Europe/London)'
+    resolution = select_resolution(start_date, pd.Timestamp(end_date) + pd.Timedelta(days=1), pixels)
+
+    series = {}
+    window = slice_date_range(data, start_date, end_date, whole_days=True)
+    if resolution == 'raw':
+        series[date_col] = window[date_col]
+        for col in columns:
+            series[col] = series[f'{col} min'] = series[f'{col} max'] = window[col]
+    else:
+        if rollups is None:
+            rollup = build_rollup(window[[date_col] + columns], *ROLLUPS[resolution])
+        else:
+            rollup = rollups[resolution]
+        window = slice_date_range(rollup, start_date, end_date, whole_days=True)
+        series[date_col] = window.index
+        for col in columns:
+            series[col] = window[(col, 'mean')].to_numpy()
+            series[f'{col} min'] = window[(col, 'min')].to_numpy()
+            series[f'{col} max'] = window[(col, 'max')].to_numpy()
+
+    series = pd.DataFrame({name: np.asarray(values) for name, values in series.items()})
+    series.attrs['resolution'] = resolution
+    return series
+
+
+def plot_envelope(ax, series, column, points=PLOT_POINTS, method=DECIMATION, **kwargs):
+    # Line through the period means of a chart_series() column, with its min/max envelope shaded in
+    # the same colour whenever the series is rolled up. Both are decimated to the point budget first
+    # ('minmax' or 'lttb', see helpers/decimation.py) so the visible extremes stay the same.
+    dates = series['Date (Europe/London)'].to_numpy()
+    values = series[column].to_numpy()
+    keep = decimate_indices(dates.astype('datetime64[s]').astype(np.int64), values, points, method)
+    lines = ax.plot(dates[keep], values[keep], **kwargs)
+
+    if series.attrs.get('resolution', 'raw') != 'raw':
+        starts, lower, upper = envelope_buckets(series[f'{column} min'].to_numpy(),
+                                                series[f'{column} max'].to_numpy(), points // 2)
+        ax.fill_between(dates[starts], lower, upper, color=lines[0].get_color(), alpha=0.25, linewidth=0)
+    return lines
+
+
+def daily_rain(data, start_date, end_date, rollups=None):
+    # Rainfall per day of data from start_date through end_date, indexed by day: the window the line
+    # series of chart_series() cover. Rain (mm) is a running daily total, so each day's max is that
+    # day's rainfall. rollups as for chart_series().
+    if rollups is None:
+        window = slice_date_range(data, start_date, end_date, whole_days=True)
+        daily = build_rollup(window[['Date (Europe/London)', 'Rain (mm)']], *ROLLUPS['daily'])
+    else:
+        daily = rollups['daily']
+    return slice_date_range(daily, start_date, end_date, whole_days=True)[('Rain (mm)', 'max')]
+
+
+def plot_bars(ax, dates, heights, width=0.8, **kwargs):
+    # Bars centred on dates (width in days) drawn as a single PolyCollection instead of one Rectangle
+    # artist per bar, so drawing & saving cost stay flat however many bars there are
+    # matplotlib is only loaded once something is drawn, so compiling the database never imports it
+    import matplotlib.dates as mdates
+    from matplotlib.collections import PolyCollection
+
+    x = mdates.date2num(dates)
+    heights = np.nan_to_num(np.asarray(heights, dtype=np.float64))
+    verts = np.zeros((len(x), 4, 2))
+    verts[:, :2, 0] = (x - width / 2)[:, None]
+    verts[:, 2:, 0] = (x + width / 2)[:, None]
+    verts[:, 1:3, 1] = heights[:, None]
+
+    kwargs.setdefault('linewidth', 0)
+    bars = PolyCollection(verts, **kwargs)
+    bars.sticky_edges.y.append(0)  # Autoscaling stops at the baseline, as it does for ax.bar()
+    ax.xaxis_date()
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+
+def date_locator(unit, step):
+    import matplotlib.dates as mdates
+    if unit == 'day':
+        return mdates.DayLocator(interval=step)
+    if unit == 'week':
+        return mdates.WeekdayLocator(byweekday=mdates.MO, interval=step)
+    if unit == 'month':
+        return mdates.MonthLocator(bymonth=range(1, 13, step))  # Quarters start in Jan, Apr, Jul & Oct
+    if unit == 'year':
+        return mdates.YearLocator(step)
+    raise ValueError(f"Unknown date tick unit: {unit}")
+
+
+def date_axis(ax, markers=DATE_MARKERS):
+    # Date ticks & grid for a time-series chart, chosen from the span of its x limits (set them first),
+    # so a multi-year chart is not drawn with a tick & grid line for every day. Returns the axis label.
+    import matplotlib.dates as mdates
+
+    x_min, x_max = ax.get_xlim()
+    span = x_max - x_min if np.isfinite(x_max - x_min) else 0  # Date axis units are days
+    for longest, major, label_format, minor, label in markers:
+        if longest is None or span <= longest:
+            break
+
+    ax.xaxis.set_major_locator(date_locator(*major))
+    ax.xaxis.set_major_formatter(mdates.DateFormatter(label_format))
+    ax.xaxis.set_minor_locator(date_locator(*minor))
+    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    return label
+
+
+def rasterise_layers(fig, min_points=RASTER_MIN_POINTS):
+    # Marks the dense data layers of every axes in fig to be drawn as images; returns how many
+    count = 0
+    for ax in fig.axes:
+        layers = [(line, len(line.get_xdata())) for line in ax.lines]
+        layers += [(collection, sum(len(path.vertices) for path in collection.get_paths()))
+                   for collection in ax.collections]
+        for artist, points in layers:
+            if points >= min_points:
+                artist.set_rasterized(True)
+                count += 1
+        if 4 * len(ax.patches) >= min_points:  # ax.bar() draws one rectangle per bar
+            for patch in ax.patches:
+                patch.set_rasterized(True)
+            count += 1
+    return count
+
+
+def save_chart(pdf, fig, analytic, raster=None, dpi=RASTER_DPI):
+    # Saves fig as the next page of pdf; raster=None uses the analytic's RASTER_LAYERS setting
+    if RASTER_LAYERS.get(analytic, False) if raster is None else raster:
+        rasterise_layers(fig)
+    pdf.savefig(fig, dpi=dpi)
 
 
 def copyright_text():
@@ -139,3 +519,28 @@ def copyright_text():
 
 def contact_details():
     return 'the.expergefactor@protonmail.com'
+
+
+# Page furniture shared by every chart, decoded once per process instead of once per page
+page_assets = {}
+
+
+def logo_image():
+    if 'logo' not in page_assets:
+        import matplotlib.image as mpimg
+        page_assets['logo'] = mpimg.imread(LOGO_PATH)
+    return page_assets['logo']
+
+
+def add_logo(fig, rect=LOGO_RECT):
+    logo_ax = fig.add_axes(rect)
+    logo_ax.imshow(logo_image(), interpolation="antialiased")
+    logo_ax.axis("off")  # Hide axes around the logo
+    return logo_ax
+
+
+def add_footer(ax, y, contact_y, fontsize=6):
+    # Copyright line & mailto link centred under the chart, y in axes fractions of ax
+    ax.text(0.5, y, copyright_text(), transform=ax.transAxes, fontsize=fontsize, color='black', ha='center')
+    ax.annotate(contact_details(), xy=(0.5, contact_y), ha='center', va='center', fontsize=7,
+                color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
@@ -1,12 +1,30 @@
 import os
+import importlib
 import subprocess
-from helpers.utilities import view_database_dates, merge_csv_files
+
+# Nothing heavy is imported here: pandas, numpy & matplotlib are loaded by helpers.utilities and the
+# analytics modules the first time a feature needs them, so the menu itself appears at once.
+# 'python3 -m helpers.startup_budget' checks this stays true.
 
 
 def clear_console():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
+def run_analytic(name):
+    # Runs modules/<name>.py in this process rather than a fresh interpreter. Each module is imported
+    # on first use and kept, so pandas, matplotlib & the loaded database are already warm for every
+    # report after the first.
+    try:
+        importlib.import_module(f'modules.{name}').main([])
+    except SystemExit as e:
+        # A report's error exit returns here instead of closing the menu
+        if e.code:
+            print(f" {e}")
+    except KeyboardInterrupt:
+        print("\n\033[1;92m You stopped the report.\033[0m\n")
+
+
 def banner():
     print(
         """\033[1;93m
@@ -27,21 +45,21 @@ def menu():
             " Utilities\n"
             "       \033[1;93m4\033[1;97m Normalise date formats in original data\n"
             "       \033[1;93m5\033[1;97m Compile database\n"
-            "       \033[1;93m6\033[1;97m View the existing database limits\n\n"
+            "       \033[1;93m6\033[1;97m View the existing database limits\n"
+            "       \033[1;93m7\033[1;97m Rebuild the database from every original file\n\n"
             " Help & Information\n"
             "       \033[1;93mi\033[1;97m Display the info/help\n"
             "       \033[1;93ml\033[1;97m View the licence\n\n"
             " Navigation Options\n"
             "       \033[1;93me\033[1;97m Exit\n\n\033[0m"
-            " \033[1;97mInput a value (\033[1;93m1\033[1;97m-\033[1;93m6\033[1;97m, \033[1;93mi\033[1;97m, "
+            " \033[1;97mInput a value (\033[1;93m1\033[1;97m-\033[1;93m7\033[1;97m, \033[1;93mi\033[1;97m, "
             "\033[1;93ml \033[1;97mor \033[1;93me\033[1;97m) and press 'enter': \033[0m"
         )
         while True:
             if choice == "1":
                 try:
-                    command = f"python3 -m modules.report_full"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('report_full')
                     input(" Press 'enter' to continue...")
                 except Exception as e:
                     print(f' Error: {e}')
@@ -53,9 +71,8 @@ def menu():
                     print(f' Error: {e}')
             if choice == "3":
                 try:
-                    command = f"python3 -m modules.snapshot"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('snapshot')
                     input(" Press 'enter' to continue...")
                 except Exception as e:
                     print(f' Error: {e}')
@@ -72,6 +89,7 @@ def menu():
                     print(f' Error: {e}')
             if choice == "5":
                 try:
+                    from helpers.utilities import merge_csv_files
                     merge_csv_files()
                     input(" Press 'enter' to continue...")
                 except Exception as e:
@@ -79,11 +97,20 @@ def menu():
                     input(" Press 'enter' to continue...")
             if choice == "6":
                 try:
+                    from helpers.utilities import view_database_dates
                     view_database_dates()
                     input(" Press 'enter' to continue...")
                 except Exception as e:
                     print(f"\n\033[1;91m ❌ Error loading data: {e}\033[0m\n")
                     input(" Press 'enter' to continue...")
+            if choice == "7":
+                try:
+                    from helpers.utilities import merge_csv_files
+                    merge_csv_files(full_rebuild=True)
+                    input(" Press 'enter' to continue...")
+                except Exception as e:
+                    print(f' Error: {e}')
+                    input(" Press 'enter' to continue...")
             if choice == "e":
                 print("\n\033[1;92m Exiting...\033[0m\n")
                 raise SystemExit()
@@ -131,9 +158,8 @@ def single_report_menu():
         while True:
             if choice == "1":
                 try:
-                    command = f"python3 -m modules.humidity"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('humidity')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -142,9 +168,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "2":
                 try:
-                    command = f"python3 -m modules.pressure"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('pressure')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -153,9 +178,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "3":
                 try:
-                    command = f"python3 -m modules.rain"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('rain')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -164,9 +188,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "4":
                 try:
-                    command = f"python3 -m modules.temperature"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('temperature')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -175,9 +198,8 @@ def single_report_menu():
                         print(f' Error: {e}')
             if choice == "5":
                 try:
-                    command = f"python3 -m modules.windgust"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('windgust')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -186,9 +208,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "6":
                 try:
-                    command = f"python3 -m modules.windspeed"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('windspeed')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -197,9 +218,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "7":
                 try:
-                    command = f"python3 -m modules.winddistribution"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('winddistribution')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -208,9 +228,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "8":
                 try:
-                    command = f"python3 -m modules.windspeedgust"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('windspeedgust')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -219,9 +238,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "9":
                 try:
-                    command = f"python3 -m modules.humidityrain"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('humidityrain')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -230,9 +248,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "10":
                 try:
-                    command = f"python3 -m modules.solaruv"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('solaruv')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -241,9 +258,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "11":
                 try:
-                    command = f"python3 -m modules.storms"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('storms')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -252,9 +268,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "12":
                 try:
-                    command = f"python3 -m modules.indoor_temp"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('indoor_temp')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -263,9 +278,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "13":
                 try:
-                    command = f"python3 -m modules.indoor_humidity"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('indoor_humidity')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -274,9 +288,8 @@ def single_report_menu():
                     print(f' Error: {e}')
             if choice == "14":
                 try:
-                    command = f"python3 -m modules.indoor_humidtemp"
                     clear_console()
-                    subprocess.run(command, shell=True)
+                    run_analytic('indoor_humidtemp')
                     input(" Press 'enter' to continue...")
                     clear_console()
                     banner()
@@ -323,7 +336,8 @@ def about():
     * Normalise data (option 4). 
       Results: "database/normalised/".
     * Compile data into a single database (option 5). New database limits will be confirmed.
-      Results: "database/compiled/ingest.csv".
+      Results: "database/compiled/ingest.csv". Only files not yet compiled are added; use
+      option 7 to rebuild from scratch.
     * View the database limits at any time (option 6).
     * Create weather reports! (options 1-3).
     * Keep adding more weather station data and ingest them into the existing database.
@@ -335,6 +349,9 @@ def about():
     
     utilities.py    Hosts various supporting functions.
     
+    database.py     Typed columnar cache of the compiled database, rebuilt whenever
+                    ingest.csv changes.
+    
     normalise.py    Function to normalise original data files prior to analysis.
     
     report_full.py  Conducts analysis of all data & creates full-page chart reports for every 
@@ -424,5 +441,7 @@ def main():
     banner()
     menu()
 
-main()
+
+if __name__ == '__main__':
+    main()
 
@@ -1,38 +1,33 @@
 import os
+import sys
 import math
+import tempfile
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import matplotlib.image as mpimg
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.lines import Line2D
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date, datetime
-from helpers.utilities import (load_data, copyright_text, get_user_date_range, get_station_location, contact_details)
+from helpers.pdfmerge import merge_pdfs
+from helpers.utilities import (load_weather_data, load_rollups, slice_date_range, chart_series, plot_envelope,
+                               daily_rain, plot_bars, copyright_text, get_station_location, contact_details,
+                               report_arguments, report_date_range, add_logo, add_footer, date_axis,
+                               save_chart)
 
 
 def clear_console():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
-def title(pdf, start_date, end_date):
-
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def title(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -46,10 +41,7 @@ def title(pdf, start_date, end_date):
              f'{data['Date (Europe/London)'].max().strftime('%d %B %Y')}',
              fontsize=30, color='black', ha='center')
 
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")
+    add_logo(fig)
 
     fig.text(0.5, 0.05, copyright_text(), fontsize=6, color='black', ha='center')
 
@@ -63,33 +55,14 @@ def title(pdf, start_date, end_date):
     print("    Generated Title Page")
 
 
-def storms(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def storms(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Atmospheric pressure (mbar)', 'Rain (mm)', 'Gust of wind (mph)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Atmospheric pressure (mbar)', 'Rain (mm)', 'Gust of wind (mph)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Atmospheric pressure (mbar)'] = \
-        (data['Atmospheric pressure (mbar)'].astype(str).str.replace(',', '', regex=True))
-    data['Atmospheric pressure (mbar)'] = pd.to_numeric(data['Atmospheric pressure (mbar)'], errors='coerce')
-
-    data['Rain (mm)'] = (data['Rain (mm)'].astype(str).str.replace(',', '', regex=True))
-    data['Rain (mm)'] = pd.to_numeric(data['Rain (mm)'], errors='coerce')
-
-    data['Gust of wind (mph)'] = (data['Gust of wind (mph)'].astype(str).str.replace(',', '', regex=True))
-    data['Gust of wind (mph)'] = pd.to_numeric(data['Gust of wind (mph)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -98,19 +71,24 @@ def storms(pdf, start_date, end_date):
     # Create the canvas
     fig, ax1 = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Gust of wind (mph)', 'Atmospheric pressure (mbar)'],
+                          start_date, end_date, rollups)
+
     # plot the data
     # Plot rainfall data on the primary y-axis. Label is for legend.
-    ax1.bar(data['Date (Europe/London)'], data['Rain (mm)'], color='darkblue', label='Rainfall (mm)')
+    rain = daily_rain(data, start_date, end_date, rollups)
+    plot_bars(ax1, rain.index + pd.Timedelta(hours=12), rain, color='darkblue', label='Rainfall (mm)')
     # Create a third y-axis
     ax2 = ax1.twinx()
     # Plot the Gust of Wind on the secondary y-axis. Label is for legend.
-    ax2.plot(data['Date (Europe/London)'], data['Gust of wind (mph)'], linestyle='solid', color='cornflowerblue',
-             label='Wind Gust (mph)', alpha=0.5)
+    plot_envelope(ax2, series, 'Gust of wind (mph)', linestyle='solid', color='cornflowerblue',
+                  label='Wind Gust (mph)', alpha=0.5)
     # Create a secondary y-axis
     ax3 = ax2.twinx()
     # Plot Air Pressure on the third y-axis. Label is for legend.
-    ax3.plot(data['Date (Europe/London)'], data['Atmospheric pressure (mbar)'], linestyle='solid', color='lime',
-             label='Air Pressure (mbar)')
+    plot_envelope(ax3, series, 'Atmospheric pressure (mbar)', linestyle='solid', color='lime',
+                  label='Air Pressure (mbar)')
 
     # x axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -152,20 +130,15 @@ def storms(pdf, start_date, end_date):
     ax3.minorticks_on()
 
     # Format the chart
-    ax1.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax1.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax1.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax1)
     ax1.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax1.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     ax2.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax2.tick_params(axis='x', which='minor', length=5, width=1)
 
     # Set axis labels
-    ax1.set_xlabel('Daily date markers')  # Date label
+    ax1.set_xlabel(date_label)  # Date label
     ax1.set_ylabel('Rainfall & Wind Gust')  # Label for y-axis (left).
     ax3.set_ylabel('Air Pressure')  # Label for y-axis (right).
 
@@ -231,49 +204,25 @@ def storms(pdf, start_date, end_date):
              color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax1.text(0.5, -1.83, copyright_text(), transform=ax1.transAxes, fontsize=6, color='black',
-             ha='center')
-
-    ax1.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax1, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'storms', raster_layers)
     plt.close()
     print("    Generated Chart: Storms")
 
 
-def humidity_rain(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def humidity_rain(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Humidity (%)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Humidity (%)', 'Rain (mm)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Humidity (%)'] = (data['Humidity (%)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Humidity (%)'] = pd.to_numeric(data['Humidity (%)'], errors='coerce')
-
-    data['Rain (mm)'] = (data['Rain (mm)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Rain (mm)'] = pd.to_numeric(data['Rain (mm)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -282,14 +231,18 @@ def humidity_rain(pdf, start_date, end_date):
     # Create the canvas
     fig, ax1 = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Humidity (%)'], start_date, end_date, rollups)
+
     # plot the data
     # Plot the atmospheric pressure data on the primary y-axis. Label is for legend.
-    ax1.bar(data['Date (Europe/London)'], data['Rain (mm)'], label='Rainfall (mm)', color='cornflowerblue')
+    rain = daily_rain(data, start_date, end_date, rollups)
+    plot_bars(ax1, rain.index + pd.Timedelta(hours=12), rain, label='Rainfall (mm)', color='cornflowerblue')
     # Create a secondary y-axis
     ax2 = ax1.twinx()
     # Plot the secondary y-axis
-    ax2.plot(data['Date (Europe/London)'], data['Humidity (%)'], linestyle='solid', color='blue',
-             label='Humidity (%)', alpha=0.7)
+    plot_envelope(ax2, series, 'Humidity (%)', linestyle='solid', color='blue',
+                  label='Humidity (%)', alpha=0.7)
 
     # x axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -324,19 +277,14 @@ def humidity_rain(pdf, start_date, end_date):
     ax2.minorticks_on()
 
     # Format the chart
-    ax1.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax1.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax1.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax1)
     ax1.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax1.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     ax2.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax2.tick_params(axis='x', which='minor', length=5, width=1)
     # Set axis labels
-    ax1.set_xlabel('Daily date markers')  # Date label
+    ax1.set_xlabel(date_label)  # Date label
     ax1.set_ylabel('Rainfall')  # Label for y-axis (left).
     ax2.set_ylabel('Humidity')  # Label for y-axis (right).
 
@@ -390,47 +338,25 @@ def humidity_rain(pdf, start_date, end_date):
              transform=ax1.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax1.text(0.5, -1.83, copyright_text(), transform=ax1.transAxes, fontsize=6, color='black',
-             ha='center')
-
-    ax1.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax1, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'humidityrain', raster_layers)
     plt.close()
     print("    Generated Chart: Humidity against Rainfall")
 
 
-def wind_speed_gust(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def wind_speed_gust(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Gust of wind (mph)', 'Average wind speed (mph)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
-
     data = data[['Date (Europe/London)', 'Gust of wind (mph)', 'Average wind speed (mph)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Gust of wind (mph)'] = (data['Gust of wind (mph)'].astype(str).str.replace(',', '', regex=True))
-    data['Gust of wind (mph)'] = pd.to_numeric(data['Gust of wind (mph)'], errors='coerce')
-
-    data['Average wind speed (mph)'] = pd.to_numeric(data['Average wind speed (mph)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -439,15 +365,18 @@ def wind_speed_gust(pdf, start_date, end_date):
     # Create the canvas
     fig, ax1 = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Average wind speed (mph)', 'Gust of wind (mph)'], start_date, end_date, rollups)
+
     # plot the data
     # Plot average wind speed on the primary y-axis
-    ax1.bar(data['Date (Europe/London)'], data['Average wind speed (mph)'], label='Wind speed (mph)',
-            color='cornflowerblue')
+    plot_bars(ax1, series['Date (Europe/London)'], series['Average wind speed (mph) max'],
+              label='Wind speed (mph)', color='cornflowerblue')
     # Create a secondary y-axis
     ax2 = ax1.twinx()
     # Plot wind gust on the secondary y-axis
-    ax2.plot(data['Date (Europe/London)'], data['Gust of wind (mph)'], linestyle='solid', color='darkblue',
-             label='Wind gust (mph)', alpha=0.3, linewidth=0.6)
+    plot_envelope(ax2, series, 'Gust of wind (mph)', linestyle='solid', color='darkblue',
+                  label='Wind gust (mph)', alpha=0.3, linewidth=0.6)
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -469,19 +398,14 @@ def wind_speed_gust(pdf, start_date, end_date):
     ax2.tick_params(axis='y', which='both', left=False, right=False, labelleft=False, labelright=False)
 
     # Format the chart
-    ax1.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax1.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax1.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax1)
     ax1.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax1.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     ax2.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax2.tick_params(axis='x', which='minor', length=5, width=1)
     # Set y axis labels
-    ax1.set_xlabel('Daily date markers')  # Date label
+    ax1.set_xlabel(date_label)  # Date label
     ax1.set_ylabel('Wind')  # Label for y-axis (left).
 
     # Set chart Titles
@@ -534,28 +458,18 @@ def wind_speed_gust(pdf, start_date, end_date):
              transform=ax1.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax1.text(0.5, -1.83, copyright_text(), transform=ax1.transAxes, fontsize=6, color='black',
-             ha='center')
-
-    ax1.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax1, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'windspeedgust', raster_layers)
     plt.close()
     print("    Generated Chart: Wind Speed against Wind Gust")
 
 
-def solaruv(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def solaruv(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Solar radiation (W/m²)', 'UV index'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
@@ -563,19 +477,7 @@ def solaruv(pdf, start_date, end_date):
     # Select columns for processing
     data = data[['Date (Europe/London)', 'Solar radiation (W/m²)', 'UV index']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Solar radiation (W/m²)'] = (data['Solar radiation (W/m²)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Solar radiation (W/m²)'] = pd.to_numeric(data['Solar radiation (W/m²)'], errors='coerce')
-
-    data['UV index'] = pd.to_numeric(data['UV index'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -584,14 +486,17 @@ def solaruv(pdf, start_date, end_date):
     # Create the canvas
     fig, ax1 = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Solar radiation (W/m²)', 'UV index'], start_date, end_date, rollups)
+
     # plot the data
     # Plot the atmospheric pressure data on the primary y-axis. Label is for legend.
-    ax1.bar(data['Date (Europe/London)'], data['Solar radiation (W/m²)'], linestyle='solid', color='gold',
-            label='Solar radiation (W/m²)')
+    plot_bars(ax1, series['Date (Europe/London)'], series['Solar radiation (W/m²) max'],
+              linestyle='solid', color='gold', label='Solar radiation (W/m²)')
     # Create a secondary y-axis
     ax2 = ax1.twinx()
     # Plot the secondary y-axis
-    ax2.plot(data['Date (Europe/London)'], data['UV index'], label='UV Index', color='red', linewidth=0.5)
+    plot_envelope(ax2, series, 'UV index', label='UV Index', color='red', linewidth=0.5)
 
     # x axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -620,19 +525,14 @@ def solaruv(pdf, start_date, end_date):
     ax2.minorticks_on()
 
     # Format the chart
-    ax1.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax1.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax1.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax1)
     ax1.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax1.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     ax2.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax2.tick_params(axis='x', which='minor', length=5, width=1)
     # Set axis labels
-    ax1.set_xlabel('Daily date markers')  # Date label
+    ax1.set_xlabel(date_label)  # Date label
     ax1.set_ylabel('Solar radiation')  # Label for y-axis (left).
     ax2.set_ylabel('UV Index')  # Label for y-axis (right).
 
@@ -690,43 +590,25 @@ def solaruv(pdf, start_date, end_date):
              transform=ax1.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax1.text(0.5, -1.83, copyright_text(), transform=ax1.transAxes, fontsize=6, color='black',
-             ha='center')
-
-    ax1.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax1, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'solaruv', raster_layers)
     plt.close()
     print("    Generated Chart: Solar Radiation against UV Index")
 
 
-def temperature(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def temperature(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Temperature (°C)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Temperature (°C)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Temperature (°C)'] = pd.to_numeric(data['Temperature (°C)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -735,9 +617,12 @@ def temperature(pdf, start_date, end_date):
     # Create the canvas
     fig, ax = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Temperature (°C)'], start_date, end_date, rollups)
+
     # plot the data
-    ax.plot(data['Date (Europe/London)'], data['Temperature (°C)'], linestyle='solid', color='darkkhaki',
-            label='Air Temperature')
+    plot_envelope(ax, series, 'Temperature (°C)', linestyle='solid', color='darkkhaki',
+                  label='Air Temperature')
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -758,18 +643,13 @@ def temperature(pdf, start_date, end_date):
     ax.minorticks_on()
 
     # Format the chart
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax)
     ax.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     # Set axis labels
     ax.set_ylabel('Air Temperature')  # Label for y-axis (left).
-    ax.set_xlabel('Daily date markers')  # Date label
+    ax.set_xlabel(date_label)  # Date label
 
     # Set chart Titles
     fig.suptitle(f"{station_location} Air Temperature", fontsize=20)
@@ -796,47 +676,25 @@ def temperature(pdf, start_date, end_date):
             ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax.text(0.5, -1.83, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-            ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'temperature', raster_layers)
     plt.close()
     print("    Generated Chart: Temperature")
 
 
-def pressure(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def pressure(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Atmospheric pressure (mbar)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Atmospheric pressure (mbar)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Atmospheric pressure (mbar)'] = \
-        (data['Atmospheric pressure (mbar)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Atmospheric pressure (mbar)'] = pd.to_numeric(data['Atmospheric pressure (mbar)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -845,9 +703,12 @@ def pressure(pdf, start_date, end_date):
     # Create the canvas
     fig, ax = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Atmospheric pressure (mbar)'], start_date, end_date, rollups)
+
     # plot the data
-    ax.plot(data['Date (Europe/London)'], data['Atmospheric pressure (mbar)'], linestyle='solid', color='lime',
-            label='Air pressure')  # Label for legend
+    plot_envelope(ax, series, 'Atmospheric pressure (mbar)', linestyle='solid', color='lime',
+                  label='Air pressure')  # Label for legend
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -868,18 +729,13 @@ def pressure(pdf, start_date, end_date):
     ax.minorticks_on()
 
     # Format the chart
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax)
     ax.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     # Set axis labels
     ax.set_ylabel('Air Pressure')  # Label for y-axis (left).
-    ax.set_xlabel('Daily date markers')  # Date label
+    ax.set_xlabel(date_label)  # Date label
 
     # Set chart Titles
     fig.suptitle(f"{station_location} Air Pressure", fontsize=20)
@@ -906,46 +762,25 @@ def pressure(pdf, start_date, end_date):
             transform=ax.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax.text(0.5, -1.83, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-            ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'pressure', raster_layers)
     plt.close()
     print("    Generated Chart: Air Pressure")
 
 
-def rain(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def rain(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Rain (mm)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
-    data = data[['Date (Europe/London)', 'Rain (mm)']]
-
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Rain (mm)'] = (data['Rain (mm)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Rain (mm)'] = pd.to_numeric(data['Rain (mm)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    # Rainfall per day, the same bars the storms & humidity/rain pages draw
+    rain = daily_rain(data, start_date, end_date, rollups)
+    data = pd.DataFrame({'Date (Europe/London)': rain.index, 'Rain (mm)': rain.to_numpy()})
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -982,19 +817,22 @@ def rain(pdf, start_date, end_date):
 
     # plot the data
     # Includes label for the legend
-    ax.bar(data['Date (Europe/London)'], data['Rain (mm)'], label='Daily Rainfall', color='cornflowerblue',
-           linestyle='solid')
+    plot_bars(ax, data['Date (Europe/London)'] + pd.Timedelta(hours=12), data['Rain (mm)'], label='Daily Rainfall',
+              color='cornflowerblue', linestyle='solid')
     if not drought_dates.empty:
-        ax.axvspan(drought_start, drought_end, color='gainsboro', alpha=0.4, label='Driest Period')
+        # Whole day cells, as the bars are drawn: from the first dry day's start to the last one's end
+        ax.axvspan(drought_start, drought_end + pd.Timedelta(days=1), color='gainsboro', alpha=0.4,
+                   label='Driest Period')
         # Insert the legend with ordering capability
     handles, labels = ax.get_legend_handles_labels()
-    order = [4, 1, 0, 2, 3]  # Reordered: Rainfall, Max, Min, Average, Max Drought
+    # Reordered: Rainfall, Max, Min, Average, Max Drought (daily totals may have no dry day at all)
+    order = [3, 1, 0, 2, 4] if not drought_dates.empty else [3, 1, 0, 2]
     ax.legend([handles[i] for i in order], [labels[i] for i in order],
               loc='lower center', bbox_to_anchor=(0.5, -0.35), ncol=5, edgecolor='lightgray')
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
-    x_max = data['Date (Europe/London)'].max()
+    x_max = data['Date (Europe/London)'].max() + pd.Timedelta(days=1)  # End of the last day's bar
     margin = (x_max - x_min) * 0.01  # 1% buffer
     ax.set_xlim(x_min - margin, x_max + margin)
 
@@ -1012,18 +850,13 @@ def rain(pdf, start_date, end_date):
     ax.minorticks_on()
 
     # Format the chart
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax)
     ax.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     # Set axis labels
     ax.set_ylabel('Daily Rainfall')  # Label for y-axis (left).
-    ax.set_xlabel('Daily date markers')  # Date label
+    ax.set_xlabel(date_label)  # Date label
 
     # Set chart Titles
     fig.suptitle(f"{station_location} Daily Rainfall", fontsize=20)
@@ -1035,46 +868,25 @@ def rain(pdf, start_date, end_date):
             transform=ax.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax.text(0.5, -1.83, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-            ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'rain', raster_layers)
     plt.close()
     print("    Generated Chart: Rainfall")
 
 
-def humidity(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def humidity(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Humidity (%)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Humidity (%)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Humidity (%)'] = (data['Humidity (%)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Humidity (%)'] = pd.to_numeric(data['Humidity (%)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -1083,9 +895,12 @@ def humidity(pdf, start_date, end_date):
     # Create the canvas
     fig, ax = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Humidity (%)'], start_date, end_date, rollups)
+
     # plot the data
-    ax.plot(data['Date (Europe/London)'], data['Humidity (%)'], linestyle='solid', color='blue',
-            label='Humidity')  # Label for legend
+    plot_envelope(ax, series, 'Humidity (%)', linestyle='solid', color='blue',
+                  label='Humidity')  # Label for legend
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -1106,18 +921,13 @@ def humidity(pdf, start_date, end_date):
     ax.minorticks_on()
 
     # Format the chart
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax)
     ax.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     # Set axis labels
     ax.set_ylabel('Humidity')  # Label for y-axis (left).
-    ax.set_xlabel('Daily date markers')  # Date label
+    ax.set_xlabel(date_label)  # Date label
 
     # Set chart Titles
     fig.suptitle(f"{station_location} Air Humidity", fontsize=20)
@@ -1144,45 +954,25 @@ def humidity(pdf, start_date, end_date):
             transform=ax.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax.text(0.5, -1.83, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-            ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'humidity', raster_layers)
     plt.close()
     print("    Generated Chart: Humidity")
 
 
-def wind_speed(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def wind_speed(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Average wind speed (mph)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Average wind speed (mph)']]
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
 
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'],
-                                                  format='%Y-%m-%d %H:%M:%S', errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Average wind speed (mph)'] = (data['Average wind speed (mph)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Average wind speed (mph)'] = pd.to_numeric(data['Average wind speed (mph)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -1191,9 +981,12 @@ def wind_speed(pdf, start_date, end_date):
     # Create the canvas
     fig, ax = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Average wind speed (mph)'], start_date, end_date, rollups)
+
     # plot the data
-    ax.plot(data['Date (Europe/London)'], data['Average wind speed (mph)'], linestyle='solid', color='darkblue',
-            label='Average wind speed') # Label for legend
+    plot_envelope(ax, series, 'Average wind speed (mph)', linestyle='solid', color='darkblue',
+                  label='Average wind speed') # Label for legend
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -1213,18 +1006,13 @@ def wind_speed(pdf, start_date, end_date):
     ax.minorticks_on()
 
     # Format the chart
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax)
     ax.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     # Set axis labels
     ax.set_ylabel('Wind Speed')  # Label for y-axis (left).
-    ax.set_xlabel('Daily date markers')  # Date label
+    ax.set_xlabel(date_label)  # Date label
 
     # Set chart Titles
     fig.suptitle(f"{station_location} Wind Speed", fontsize=20)
@@ -1250,44 +1038,25 @@ def wind_speed(pdf, start_date, end_date):
             transform=ax.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax.text(0.5, -1.83, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-             ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'windspeed', raster_layers)
     plt.close()
     print("    Generated Chart: Wind Speed")
 
 
-def wind_gust(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def wind_gust(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Gust of wind (mph)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Gust of wind (mph)']]
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
 
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Gust of wind (mph)'] = (data['Gust of wind (mph)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Gust of wind (mph)'] = pd.to_numeric(data['Gust of wind (mph)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -1296,9 +1065,12 @@ def wind_gust(pdf, start_date, end_date):
     # Create the canvas
     fig, ax = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Gust of wind (mph)'], start_date, end_date, rollups)
+
     # plot the data
-    ax.plot(data['Date (Europe/London)'], data['Gust of wind (mph)'], linestyle='solid', color='darkblue',
-            label='Wind Gust') # Label for legend
+    plot_envelope(ax, series, 'Gust of wind (mph)', linestyle='solid', color='darkblue',
+                  label='Wind Gust') # Label for legend
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -1318,18 +1090,13 @@ def wind_gust(pdf, start_date, end_date):
     ax.minorticks_on()
 
     # Format the chart
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-        # Minor ticks for every day
-    ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-        # Enable grid
-    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax)
     ax.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
        # Set axis labels
     ax.set_ylabel('Wind Gust') # Label for y-axis (left).
-    ax.set_xlabel('Daily date markers')  # Date label
+    ax.set_xlabel(date_label)  # Date label
 
     # Set chart Titles
     fig.suptitle(f"{station_location} Wind Gust", fontsize=20)
@@ -1355,46 +1122,23 @@ def wind_gust(pdf, start_date, end_date):
             transform=ax.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax.text(0.5, -1.83, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-             ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'windgust', raster_layers)
     plt.close()
     print("    Generated Chart: Wind Gust")
 
 
-def wind_direction(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def wind_direction(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Average wind speed (mph)', 'Average wind direction (°)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Average wind direction (°)'] = (data['Average wind direction (°)'].astype(str).str.replace(',', '',
-                                                                                                     regex=True))
-
-    data['Average wind direction (°)'] = pd.to_numeric(data['Average wind direction (°)'], errors='coerce')
-
-    data['Average wind speed (mph)'] = pd.to_numeric(data['Average wind speed (mph)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -1433,43 +1177,25 @@ def wind_direction(pdf, start_date, end_date):
                   f"{data['Date (Europe/London)'].max().strftime('%d %B %Y')}", fontsize=12, loc='center', y=1.05)
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.06, 0.07, 0.07])  # left, bottom, width, height
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig, [0.47, 0.06, 0.07, 0.07])
 
     # Author details
-    ax.text(0.5, -0.25, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-            ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -0.27), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -0.25, -0.27)
 
     plt.subplots_adjust(left=0.2, right=0.8, top=0.85, bottom=0.2)
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'winddistribution', raster_layers)
     plt.close()
     print("    Generated Chart: Wind Direction Distribution")
 
 
-def temperature_indoor(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def temperature_indoor(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Inside temperature (°C)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Inside temperature (°C)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Inside temperature (°C)'] = pd.to_numeric(data['Inside temperature (°C)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -1478,9 +1204,12 @@ def temperature_indoor(pdf, start_date, end_date):
     # Create the canvas
     fig, ax = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Inside temperature (°C)'], start_date, end_date, rollups)
+
     # plot the data
-    ax.plot(data['Date (Europe/London)'], data['Inside temperature (°C)'], linestyle='solid', color='darkkhaki',
-            label='Inside temperature (°C)')
+    plot_envelope(ax, series, 'Inside temperature (°C)', linestyle='solid', color='darkkhaki',
+                  label='Inside temperature (°C)')
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -1501,18 +1230,13 @@ def temperature_indoor(pdf, start_date, end_date):
     ax.minorticks_on()
 
     # Format the chart
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax)
     ax.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     # Set axis labels
     ax.set_ylabel('Indoor Air Temperature')  # Label for y-axis (left).
-    ax.set_xlabel('Daily date markers')  # Date label
+    ax.set_xlabel(date_label)  # Date label
 
     # Set chart Titles
     fig.suptitle("Indoor Air Temperature", fontsize=20)
@@ -1539,46 +1263,25 @@ def temperature_indoor(pdf, start_date, end_date):
             ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax.text(0.5, -1.83, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-            ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'indoor_temp', raster_layers)
     plt.close()
     print("    Generated Chart: Indoor Temperature")
 
 
-def humidity_indoor(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def humidity_indoor(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Inside humidity (%)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Inside humidity (%)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Inside humidity (%)'] = (data['Inside humidity (%)'].astype(str).str.replace(',', '', regex=True))
-
-    data['Inside humidity (%)'] = pd.to_numeric(data['Inside humidity (%)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -1587,9 +1290,12 @@ def humidity_indoor(pdf, start_date, end_date):
     # Create the canvas
     fig, ax = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Inside humidity (%)'], start_date, end_date, rollups)
+
     # plot the data
-    ax.plot(data['Date (Europe/London)'], data['Inside humidity (%)'], linestyle='solid', color='blue',
-            label='Indoor Air Humidity (%)')  # Label for legend
+    plot_envelope(ax, series, 'Inside humidity (%)', linestyle='solid', color='blue',
+                  label='Indoor Air Humidity (%)')  # Label for legend
 
     # X-axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -1610,18 +1316,13 @@ def humidity_indoor(pdf, start_date, end_date):
     ax.minorticks_on()
 
     # Format the chart
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax)
     ax.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     # Set axis labels
     ax.set_ylabel('Indoor Air Humidity')  # Label for y-axis (left).
-    ax.set_xlabel('Daily date markers')  # Date label
+    ax.set_xlabel(date_label)  # Date label
 
     # Set chart Titles
     fig.suptitle("Indoor Air Humidity", fontsize=20)
@@ -1648,46 +1349,25 @@ def humidity_indoor(pdf, start_date, end_date):
             transform=ax.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax.text(0.5, -1.83, copyright_text(), transform=ax.transAxes, fontsize=6, color='black',
-            ha='center')
-
-    ax.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'indoor_humidity', raster_layers)
     plt.close()
     print("    Generated Chart: Indoor Humidity")
 
 
-def temperature_humidity_indoor(pdf, start_date, end_date):
-    data = load_data()
-
-    data.columns = [col.strip() for col in data.columns]
+def temperature_humidity_indoor(pdf, data, start_date, end_date, rollups):
     expected_columns = {'Date (Europe/London)', 'Inside humidity (%)', 'Inside temperature (°C)'}
     if not expected_columns.issubset(data.columns):
         raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
     data = data[['Date (Europe/London)', 'Inside humidity (%)', 'Inside temperature (°C)']]
 
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-
-    data = data.sort_values(by='Date (Europe/London)')
-
-    data['Inside humidity (%)'] = (data['Inside humidity (%)'].astype(str).str.replace(',', '', regex=True))
-    data['Inside humidity (%)'] = pd.to_numeric(data['Inside humidity (%)'], errors='coerce')
-
-    data['Inside temperature (°C)'] = pd.to_numeric(data['Inside temperature (°C)'], errors='coerce')
-
-    data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
     if data.empty:
         print("\n\033[1;93m Warning: No data available for the selected date range.\n"
               " Use function 1 to check the database date range.\033[0m\n")
@@ -1696,15 +1376,18 @@ def temperature_humidity_indoor(pdf, start_date, end_date):
     # Create the canvas
     fig, ax1 = plt.subplots(figsize=(11.69, 8.27))  # A4 landscape size in inches
 
+    # Read at the coarsest resolution that still fills the chart width
+    series = chart_series(data, ['Inside temperature (°C)', 'Inside humidity (%)'], start_date, end_date, rollups)
+
     # plot the data
     # Plot the atmospheric pressure data on the primary y-axis. Label is for legend.
-    ax1.bar(data['Date (Europe/London)'], data['Inside temperature (°C)'], label='Indoor temperature (°C)',
-            color='darkkhaki')
+    plot_bars(ax1, series['Date (Europe/London)'], series['Inside temperature (°C) max'],
+              label='Indoor temperature (°C)', color='darkkhaki')
     # Create a secondary y-axis
     ax2 = ax1.twinx()
     # Plot the secondary y-axis
-    ax2.plot(data['Date (Europe/London)'], data['Inside humidity (%)'], linestyle='solid', color='blue',
-             label='Indoor humidity (%)', alpha=0.7)
+    plot_envelope(ax2, series, 'Inside humidity (%)', linestyle='solid', color='blue',
+                  label='Indoor humidity (%)', alpha=0.7)
 
     # x axis configuration
     x_min = data['Date (Europe/London)'].min()
@@ -1739,19 +1422,14 @@ def temperature_humidity_indoor(pdf, start_date, end_date):
     ax2.minorticks_on()
 
     # Format the chart
-    ax1.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%b %y'))
-    # Minor ticks for every day
-    ax1.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-    # Enable grid
-    ax1.grid(which='both', linestyle=':', linewidth=0.5, color='gainsboro')
+    # Date ticks & grid, as dense as the span allows
+    date_label = date_axis(ax1)
     ax1.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax1.tick_params(axis='x', which='minor', length=5, width=1, labelbottom=False)
     ax2.tick_params(axis='x', which='major', length=10, width=1, pad=5)
     ax2.tick_params(axis='x', which='minor', length=5, width=1)
     # Set axis labels
-    ax1.set_xlabel('Daily date markers')  # Date label
+    ax1.set_xlabel(date_label)  # Date label
     ax1.set_ylabel('Indoor Temperature')  # Label for y-axis (left).
     ax2.set_ylabel('Indoor Humidity')  # Label for y-axis (right).
 
@@ -1805,44 +1483,193 @@ def temperature_humidity_indoor(pdf, start_date, end_date):
             transform=ax1.transAxes, fontsize=10, color='black', ha='center')
 
     # Insert logo
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.08, 0.07, 0.07])  # Adjust position & size (left, bottom, width, height)
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")  # Hide axes around the logo
+    add_logo(fig)
 
     # Author details
-    ax1.text(0.5, -1.83, copyright_text(), transform=ax1.transAxes, fontsize=6, color='black',
-            ha='center')
-
-    ax1.annotate(contact_details(), xy=(0.5, -1.9), ha='center', va='center', fontsize=7,
-                 color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    add_footer(ax1, -1.83, -1.9)
 
     plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.6)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
+    save_chart(pdf, fig, 'indoor_humidtemp', raster_layers)
     plt.close()
     print("    Generated Chart: Humidity")
 
 
-def generate_full_report():
-    data = load_data()
+# Report pages in print order, each drawn from the database & its rollups
+PUBLIC_PAGES = [title, storms, humidity_rain, wind_speed_gust, solaruv, temperature, pressure, rain, humidity,
+                wind_speed, wind_gust, wind_direction]
+PRIVATE_PAGES = [temperature_indoor, humidity_indoor, temperature_humidity_indoor]
+
+# Pages are rendered by this many worker processes, each into its own single-page PDF, then joined in
+# order. 1 renders every page in this process straight into the report.
+REPORT_WORKERS = os.cpu_count() or 1
+
+# Batch rule periods → pandas period-start frequency
+BATCH_PERIODS = {'monthly': 'MS', 'quarterly': 'QS', 'yearly': 'YS'}
+
+worker_tables = {}
+
+
+def init_worker(location, raster):
+    # Each worker maps the same columnar cache read-only, so the tables are not copied per process.
+    # Per-chart prints are silenced; the parent shows one progress line for both reports instead.
+    global station_location, raster_layers
+    station_location = location
+    raster_layers = raster
+    sys.stdout = open(os.devnull, 'w')
+    worker_tables['data'] = load_weather_data()
+    worker_tables['rollups'] = load_rollups()
+
+
+def render_page(chart, start_date, end_date, page_path):
+    # Returns the page's file, or None when the chart had no data in range and saved nothing
+    with PdfPages(page_path) as pdf:
+        chart(pdf, worker_tables['data'], start_date, end_date, worker_tables['rollups'])
+    return page_path if os.path.exists(page_path) else None
+
+
+def report_generated(label, filename):
+    print(f'\n\033[1;93m    {label} report generated: '
+          f'\n    {filename}\n\033[0m')
+
+
+def report_empty(label):
+    print(f'\n\033[1;93m    No {label} report produced: none of its charts had data in range\n\033[0m')
+
+
+def show_progress(reports, done):
+    # One line covering every report: counts for those still rendering, plus how many are finished
+    total = sum(len(pages) for _, pages, *_ in reports)
+    finished = sum(done[label] == len(pages) for label, pages, *_ in reports)
+    parts = [f"{label} {done[label]}/{len(pages)}" for label, pages, *_ in reports if 0 < done[label] < len(pages)]
+    if len(reports) > 2:
+        parts.append(f"{finished}/{len(reports)} reports done")
+    print(f"\r    Rendering pages: {sum(done.values())}/{total}  ({', '.join(parts)})\033[K", end='', flush=True)
+
+
+def render_reports(pool, reports, tables, page_dir=None):
+    # reports: (label, pages, filename, start_date, end_date). Without a pool each report is drawn in
+    # turn in this process; with one, the pages of all reports are queued together and each report is
+    # joined as soon as its own last page is in, so a short report never waits behind a long one.
+    # Pool pages are written to page_dir first. Returns the files written; a report whose charts all
+    # had no data in range is not saved.
+    written = []
+    if pool is None:
+        for label, pages, filename, start_date, end_date in reports:
+            with PdfPages(filename) as pdf:
+                for chart in pages:
+                    chart(pdf, tables['data'], start_date, end_date, tables['rollups'])
+            if os.path.exists(filename):  # PdfPages only creates the file with its first page
+                written.append(filename)
+                report_generated(label, filename)
+            else:
+                report_empty(label)
+        return written
+
+    # Queued round-robin across the reports of one date window, window after window
+    queue = sorted(((n, i, label, chart, start_date, end_date)
+                    for n, (label, pages, _, start_date, end_date) in enumerate(reports)
+                    for i, chart in enumerate(pages)),
+                   key=lambda page: (reports[page[0]][3], reports[page[0]][4], page[1]))
+    futures = {}
+    for n, i, label, chart, start_date, end_date in queue:
+        page_path = os.path.join(page_dir, f'{n:03d}_{i:02d}_{chart.__name__}.pdf')
+        futures[pool.submit(render_page, chart, start_date, end_date, page_path)] = (n, i)
+
+    page_paths = [[None] * len(pages) for _, pages, *_ in reports]
+    done = {label: 0 for label, *_ in reports}
+    show_progress(reports, done)
+
+    for future in as_completed(futures):
+        n, i = futures[future]
+        label, pages, filename, *_ = reports[n]
+        page_paths[n][i] = future.result()
+        done[label] += 1
+        show_progress(reports, done)
+
+        if done[label] == len(pages):
+            paths = [path for path in page_paths[n] if path]
+            print()
+            if paths:
+                merge_pdfs(paths, filename)
+                written.append(filename)
+                report_generated(label, filename)
+            else:
+                report_empty(label)
+    return written
+
+
+def run_reports(reports, tables, workers):
+    # No more workers than pages: each one imports matplotlib & maps the cache before its first page
+    workers = min(workers, sum(len(pages) for _, pages, *_ in reports))
+    if workers <= 1:
+        return render_reports(None, reports, tables)
+
+    with tempfile.TemporaryDirectory() as page_dir:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                   initargs=(station_location, raster_layers))
+        try:
+            return render_reports(pool, reports, tables, page_dir)
+        finally:
+            # After a failed page the ones still queued are dropped instead of rendered first; pages
+            # already running finish before page_dir is removed
+            pool.shutdown(cancel_futures=True)
+
+
+def batch_windows(rule, data):
+    # Date windows for a batch run, clipped to the data held. rule is either a period and optional
+    # years ('monthly 2025', 'quarterly 2024-2025', 'yearly'), or explicit windows separated by
+    # commas ('01-01-2025:31-03-2025, 01-04-2025:30-06-2025'). Windows with no data are skipped.
+    first = data['Date (Europe/London)'].min().normalize()
+    last = data['Date (Europe/London)'].max().normalize()
+
+    if ':' in rule:
+        windows = []
+        for window in rule.split(','):
+            start_date, end_date = (pd.to_datetime(day.strip(), format='%d-%m-%Y') for day in window.split(':'))
+            if start_date > end_date:
+                raise ValueError(f"Window starts after it ends: {window.strip()}")
+            windows.append((start_date, end_date))
+    else:
+        words = rule.split()
+        if not words or words[0] not in BATCH_PERIODS:
+            raise ValueError(f"Unknown batch rule: {rule} (use {', '.join(BATCH_PERIODS)} or explicit windows)")
+        years = words[1].split('-') if len(words) > 1 else [first.year, last.year]
+        periods = pd.date_range(f'{years[0]}-01-01', f'{int(years[-1]) + 1}-01-01', freq=BATCH_PERIODS[words[0]])
+        # Each window names its first & last day; charts draw both whole, so windows tile the period
+        windows = [(start_date, next_start - pd.Timedelta(days=1))
+                   for start_date, next_start in zip(periods[:-1], periods[1:])]
+
+    clipped = []
+    for start_date, end_date in windows:
+        if end_date < first or start_date > last:
+            print(f"    Skipped {start_date.strftime('%d/%m/%Y')} - {end_date.strftime('%d/%m/%Y')}: no data held")
+            continue
+        clipped.append((max(start_date, first), min(end_date, last)))
+    return clipped
+
+
+def generate_full_report(location=None, start_date=None, end_date=None, out=None, workers=REPORT_WORKERS,
+                         raster=None):
+    # Public & private reports for start_date → end_date (asked for when not given), saved in the out
+    # folder (default analytics/). Load, type and sort the database once; every chart below only
+    # selects columns from it. raster: True/False for every page, None for each analytic's RASTER_LAYERS.
+    # Returns the reports written; one whose charts all had no data in range is left out.
+    global station_location, raster_layers
+    if location is not None:
+        station_location = location
+    raster_layers = raster
+
+    data = load_weather_data()
+    tables = {'data': data, 'rollups': load_rollups()}
 
-    data.columns = [col.strip() for col in data.columns]
-    expected_columns = {'Date (Europe/London)'}
-    if not expected_columns.issubset(data.columns):
-        raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
-    data = data[['Date (Europe/London)']]
-    data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
-    data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                                  errors='coerce')
-    data = data.sort_values(by='Date (Europe/London)')
     # Print data ranges
     print("\n Data range found:")
     print(f"    Start: {data['Date (Europe/London)'].min().strftime('%d/%m/%Y')}")
     print(f"    End:   {data['Date (Europe/London)'].max().strftime('%d/%m/%Y')}")
 
-    start_date, end_date = get_user_date_range(data)
+    start_date, end_date = report_date_range(data, start_date, end_date)
 
-    analytics_path = 'analytics/'
+    analytics_path = os.path.join(out or 'analytics', '')
     os.makedirs(analytics_path, exist_ok=True)
 
     current_date = date.today()
@@ -1850,44 +1677,67 @@ def generate_full_report():
 
     public_pdf_filename = (f'{analytics_path}{current_date.strftime('%d%m%Y')}_{current_time.strftime('%H:%M')}hrs_'
                            f'{station_location}_Public_Weather_Report.pdf')
-
-    with PdfPages(public_pdf_filename) as pdf:
-        title(pdf, start_date, end_date)
-        storms(pdf, start_date, end_date)
-        humidity_rain(pdf, start_date, end_date)
-        wind_speed_gust(pdf, start_date, end_date)
-        solaruv(pdf, start_date, end_date)
-        temperature(pdf, start_date, end_date)
-        pressure(pdf, start_date, end_date)
-        rain(pdf, start_date, end_date)
-        humidity(pdf, start_date, end_date)
-        wind_speed(pdf, start_date, end_date)
-        wind_gust(pdf, start_date, end_date)
-        wind_direction(pdf, start_date, end_date)
-
-    print(f'\n\033[1;93m    Public report generated: '
-          f'\n    {public_pdf_filename}\n\033[0m')
-
     private_pdf_filename = (f'{analytics_path}{current_date.strftime('%d%m%Y')}_{current_time.strftime('%H:%M')}hrs_'
                             f'{station_location}_Private_Weather_Report.pdf')
 
-    with PdfPages(private_pdf_filename) as pdf:
-        temperature_indoor(pdf, start_date, end_date)
-        humidity_indoor(pdf, start_date, end_date)
-        temperature_humidity_indoor(pdf, start_date, end_date)
+    reports = [('Public', PUBLIC_PAGES, public_pdf_filename, start_date, end_date),
+               ('Private', PRIVATE_PAGES, private_pdf_filename, start_date, end_date)]
+    return run_reports(reports, tables, workers)
+
+
+def generate_batch_reports(rule, location=None, out=None, workers=REPORT_WORKERS, raster=None):
+    # Public & private reports for every window of the rule (see batch_windows) from one load of the
+    # data; the rollups behind each chart are opened once per process and shared by all windows
+    global station_location, raster_layers
+    if location is not None:
+        station_location = location
+    raster_layers = raster
 
-    print(f'\n\033[1;93m    Private report generated: '
-          f'\n    {private_pdf_filename}\n\033[0m')
+    data = load_weather_data()
+    tables = {'data': data, 'rollups': load_rollups()}
 
+    windows = batch_windows(rule, data)
+    print(f"\n Batch: {len(windows)} date windows, {2 * len(windows)} reports")
+
+    analytics_path = os.path.join(out or 'analytics', '')
+    os.makedirs(analytics_path, exist_ok=True)
 
-def main():
+    reports = []
+    for start_date, end_date in windows:
+        window = f"{start_date.strftime('%d%m%Y')}-{end_date.strftime('%d%m%Y')}"
+        for kind, pages in (('Public', PUBLIC_PAGES), ('Private', PRIVATE_PAGES)):
+            filename = f'{analytics_path}{window}_{station_location}_{kind}_Weather_Report.pdf'
+            reports.append((f'{kind} {window}', pages, filename, start_date, end_date))
+    return run_reports(reports, tables, workers)
+
+
+def main(argv=None):
+    parser = report_arguments('Public & private weather reports.',
+                              out_help='folder to save the reports in (default: analytics/)')
+    parser.add_argument('--batch', metavar='RULE',
+                        help="report every window of RULE in one run: 'monthly 2025', 'quarterly 2024-2025', "
+                             "'yearly', or 'DD-MM-YYYY:DD-MM-YYYY, ...'")
+    parser.add_argument('--workers', type=int, default=REPORT_WORKERS, metavar='N',
+                        help=f'processes rendering pages (default: {REPORT_WORKERS}); 1 renders them in this process')
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    global station_location
+    # Asked here rather than at import, so worker processes importing this module don't prompt
+    station_location = args.location if args.location is not None else get_station_location()
     try:
-        generate_full_report()
+        if args.batch:
+            generate_batch_reports(args.batch, out=args.out, workers=args.workers, raster=args.raster)
+        else:
+            generate_full_report(start_date=args.start, end_date=args.end, out=args.out, workers=args.workers,
+                                 raster=args.raster)
     except Exception as e:
         print(f"{e}")
 
 
-station_location = get_station_location()
+station_location = None
+raster_layers = None
 
 
 if __name__ == '__main__':
@@ -1,85 +1,26 @@
-import chardet
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.gridspec import GridSpec
 from matplotlib.table import Table
 from datetime import datetime, date
 from pathlib import Path
-from helpers.utilities import (copyright_text, get_station_location, contact_details)
-
-
-try:
-    station_location = get_station_location()
-except Exception as exception:
-    print(f"{exception}")
-except KeyboardInterrupt as kbi:
-    print(f"{kbi}")
-
-
-def load_data(csv_path: str | Path = "database/compiled/ingest.csv") -> pd.DataFrame:
-    csv_path = Path(csv_path)
-
-    try:
-        with csv_path.open("rb") as f:
-            raw_sample = f.read(10_240)
-    except FileNotFoundError:
-        raise FileNotFoundError(f" ❌ File not found: {csv_path}") from None
-
-    detection = chardet.detect(raw_sample)
-    enc = detection.get("encoding")
-    conf = detection.get("confidence", 0)
-
-    if not enc:
-        raise UnicodeError(" ❌ chardet could not determine an encoding for the file.")
-
-    def _read(encoding: str, replace_errors: bool = False) -> pd.DataFrame:
-        kwargs = {"encoding": encoding}
-        if replace_errors:
-            kwargs["errors"] = "replace"
-        with csv_path.open("r", **kwargs) as fh:
-            return pd.read_csv(fh, sep=";", skip_blank_lines=True, header=0, na_values=["", " "], on_bad_lines="skip",
-                               engine="python")
-
-    try:
-        df = _read(enc, replace_errors=False)
-        print(f" Loaded with encoding: {enc}")
-        return df
-    except Exception as exc:
-        print(f" Detected encoding '{enc}' raised an error: {exc}")
-        print(" Retrying with the same encoding using error replacement...")
-        df = _read(enc, replace_errors=True)
-        print(f" Loaded (with replacement) using encoding: {enc}")
-        return df
-
-
-def load_and_prepare(csv_path: Path = Path("database/compiled/ingest.csv")) -> pd.DataFrame:
-    df = load_data(csv_path)
-
-    # Strip whitespace from column names
-    df.columns = [c.strip() for c in df.columns]
-
-    # Parse the date column
-    date_col = "Date (Europe/London)"
-    if date_col not in df.columns:
-        raise KeyError(f" Expected column '{date_col}' not found in CSV.")
-    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-    df.set_index(date_col, inplace=True)
-
-    # Convert everything else to numeric (commas removed, bad values → NaN)
-    for col in df.columns:
-        df[col] = pd.to_numeric(
-            df[col].astype(str).str.replace(",", ""), errors="coerce"
-        )
-    return df
+from helpers.utilities import (copyright_text, get_station_location, contact_details, load_weather_data,
+                               load_rollup, slice_date_range, report_arguments, add_logo)
+from helpers.database import build_rollup, ROLLUPS
+
+
+def load_weather_frame() -> pd.DataFrame:
+    # The shared typed database (memory-mapped cache), indexed by timestamp for the summaries below
+    return load_weather_data().set_index("Date (Europe/London)")
 
 
 # prompt user-defined date range for Snapshot
-def prompt_date_range(df: pd.DataFrame) -> tuple[pd.DataFrame, date, date]:
-    min_date = df.index.min().date()
-    max_date = df.index.max().date()
+def prompt_date_range(df: pd.DataFrame) -> tuple[date, date]:
+    # The index is sorted, so the range ends are simply the first and last rows
+    min_date = df.index[0].date()
+    max_date = df.index[-1].date()
     print(f"\n \033[1;93mData range {min_date.strftime('%d/%m/%Y')} → {max_date.strftime('%d/%m/%Y')}\n\033[0m")
 
     def ask_one(prompt_msg: str, default: date) -> date:
@@ -106,13 +47,32 @@ def prompt_date_range(df: pd.DataFrame) -> tuple[pd.DataFrame, date, date]:
     if start > end:
         print(" Start date is after end date.")
         start, end = end, start
+    return start, end
+
+
+# Dates given on the command line get the same bounds check as typed ones
+def check_date_range(df: pd.DataFrame, start: date, end: date) -> tuple[date, date]:
+    min_date = df.index[0].date()
+    max_date = df.index[-1].date()
+    for day in (start, end):
+        if day < min_date or day > max_date:
+            raise SystemExit(
+                f" Date must be between {min_date.strftime('%d-%m-%Y')} and {max_date.strftime('%d-%m-%Y')}."
+            )
+
+    if start > end:
+        print(" Start date is after end date.")
+        start, end = end, start
+    return start, end
 
-    mask = (df.index.date >= start) & (df.index.date <= end)
-    filtered = df.loc[mask]
+
+def filter_date_range(df: pd.DataFrame, start: date, end: date) -> pd.DataFrame:
+    # Binary search on the sorted index for whole calendar days, no per-row date objects
+    filtered = slice_date_range(df, start, end, whole_days=True)
     print(
         f"\n Used {len(filtered)} rows of data from {start.strftime('%d/%m/%Y')} → {end.strftime('%d/%m/%Y')}\n"
     )
-    return filtered, start, end
+    return filtered
 
 
 # HELPERS ↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓↓
@@ -147,24 +107,30 @@ def compute_col_widths(table_data: list[list[str]]) -> list[float]:
     return [length / total for length in max_lengths]
 
 
-def compute_daily_max_sum(series: pd.Series) -> float:
+def compute_daily_max_sum(series: pd.Series, daily: pd.DataFrame | None = None) -> float:
     if series.empty:
         return np.nan
+    # Rain (mm) is a running daily total, so the day's max is its rainfall; read from the daily rollup
+    if daily is not None:
+        return daily[(series.name, "max")].sum()
     daily_max = series.groupby(series.index.date).max()
     return daily_max.sum()
 
 
-def compute_driest_period(df: pd.DataFrame, date_fmt: str = "%d %b") -> str:
+def compute_driest_period(df: pd.DataFrame, date_fmt: str = "%d %b", daily: pd.DataFrame | None = None) -> str:
     if df.empty or "Rain (mm)" not in df.columns:
         return "–"
 
-    daily_max = (
-        df["Rain (mm)"]
-        .fillna(0)
-        .groupby(df.index.date)
-        .max()
-    )
-    daily_max.index = pd.to_datetime(daily_max.index)
+    if daily is not None:
+        daily_max = daily[("Rain (mm)", "max")].fillna(0)
+    else:
+        daily_max = (
+            df["Rain (mm)"]
+            .fillna(0)
+            .groupby(df.index.date)
+            .max()
+        )
+        daily_max.index = pd.to_datetime(daily_max.index)
 
     dry_mask = daily_max == 0
 
@@ -202,7 +168,7 @@ def compute_driest_period(df: pd.DataFrame, date_fmt: str = "%d %b") -> str:
     return f"{start_str} – {end_str} ({longest_len} days)"
 
 
-def build_ytd_summary(df: pd.DataFrame, date_fmt: str = "%d %b") -> pd.DataFrame:
+def build_ytd_summary(df: pd.DataFrame, date_fmt: str = "%d %b", daily: pd.DataFrame | None = None) -> pd.DataFrame:
     def deg_to_compass(deg: float) -> str:
         if np.isnan(deg):
             return "–"
@@ -220,7 +186,7 @@ def build_ytd_summary(df: pd.DataFrame, date_fmt: str = "%d %b") -> pd.DataFrame
     hottest_day = f"{hottest_idx.strftime(date_fmt)} ({df.at[hottest_idx, 'Temperature (°C)']:.1f}°C)"
     coldest_idx = df["Temperature (°C)"].idxmin()
     coldest_day = f"{coldest_idx.strftime(date_fmt)} ({df.at[coldest_idx, 'Temperature (°C)']:.1f}°C)"
-    driest_period_str = compute_driest_period(df, date_fmt=date_fmt)
+    driest_period_str = compute_driest_period(df, date_fmt=date_fmt, daily=daily)
     wettest_idx = df["Rain (mm)"].idxmax()
     wettest_day = f"{wettest_idx.strftime(date_fmt)} (Total: {df.at[wettest_idx, 'Rain (mm)']:.1f} mm)"
     if "Rain rate (mm/h)" in df.columns:
@@ -228,7 +194,7 @@ def build_ytd_summary(df: pd.DataFrame, date_fmt: str = "%d %b") -> pd.DataFrame
         biggest_downpour = f"{downpour_idx.strftime(date_fmt)} ({df.at[downpour_idx, 'Rain rate (mm/h)']:.1f} mm/hour)"
     else:
         biggest_downpour = "–"
-    total_rain = compute_daily_max_sum(df["Rain (mm)"])
+    total_rain = compute_daily_max_sum(df["Rain (mm)"], daily=daily)
     total_rain_str = f"{total_rain:.1f} mm" if not np.isnan(total_rain) else "–"
     avg_deg = df["Average wind direction (°)"].mean()
     avg_wind_label = f"{deg_to_compass(avg_deg)} ({int(round(avg_deg))}°)"
@@ -252,7 +218,7 @@ def build_ytd_summary(df: pd.DataFrame, date_fmt: str = "%d %b") -> pd.DataFrame
     return pd.DataFrame(rows, columns=["Metric", "Value"])
 
 
-def build_auxiliary_summary(df: pd.DataFrame) -> pd.DataFrame:
+def build_auxiliary_summary(df: pd.DataFrame, daily: pd.DataFrame | None = None) -> pd.DataFrame:
     def deg_to_compass(deg: float) -> str:
         if np.isnan(deg):
             return "–"
@@ -270,10 +236,10 @@ def build_auxiliary_summary(df: pd.DataFrame) -> pd.DataFrame:
     hottest_day = f"{hottest_idx.strftime('%d %b')} ({df.at[hottest_idx, 'Temperature (°C)']:.1f}°C)"
     coldest_idx = df["Temperature (°C)"].idxmin()
     coldest_day = f"{coldest_idx.strftime('%d %b')} ({df.at[coldest_idx, 'Temperature (°C)']:.1f}°C)"
-    driest_period_str = compute_driest_period(df)
+    driest_period_str = compute_driest_period(df, daily=daily)
     wettest_idx = df["Rain (mm)"].idxmax()
     wettest_day = f"{wettest_idx.strftime('%d %b')} (Total: {df.at[wettest_idx, 'Rain (mm)']:.1f} mm)"
-    total_rain = compute_daily_max_sum(df["Rain (mm)"])
+    total_rain = compute_daily_max_sum(df["Rain (mm)"], daily=daily)
     total_rain_str = f"{total_rain:.1f} mm" if not np.isnan(total_rain) else "–"
     avg_deg = df["Average wind direction (°)"].mean()
     avg_wind_label = f"{deg_to_compass(avg_deg)} ({int(round(avg_deg))}°)"
@@ -306,7 +272,7 @@ def build_auxiliary_summary(df: pd.DataFrame) -> pd.DataFrame:
 
 # generate pdf
 def save_as_pdf(main_tbl: pd.DataFrame, aux_tbl: pd.DataFrame, out_path: Path, start: date, end: date,
-                raw_df: pd.DataFrame, full_df: pd.DataFrame = None,):
+                raw_df: pd.DataFrame, full_df: pd.DataFrame = None, station_location: str = "",):
 
     aux_tbl = aux_tbl.set_index("Metric")
     main_tbl = main_tbl.set_index("Metric")
@@ -379,10 +345,7 @@ def save_as_pdf(main_tbl: pd.DataFrame, aux_tbl: pd.DataFrame, out_path: Path, s
             cell.set_edgecolor(full_edge)
 
     # footer
-    logo = mpimg.imread("helpers/img/logo.jpg")
-    logo_ax = fig.add_axes([0.47, 0.34, 0.07, 0.07])  # horizontal, vertical, size width, size height
-    logo_ax.imshow(logo, interpolation="antialiased")
-    logo_ax.axis("off")
+    add_logo(fig, [0.47, 0.34, 0.07, 0.07])
 
     ax_footer = fig.add_subplot(gs[1, 0])
     ax_footer.axis("off")
@@ -426,10 +389,16 @@ def save_as_pdf(main_tbl: pd.DataFrame, aux_tbl: pd.DataFrame, out_path: Path, s
     print(f" \033[1;92mPDF saved to {out_path}\n\033[0m")
 
 
-if __name__ == "__main__":
-    df_weather = load_and_prepare(Path("database/compiled/ingest.csv"))
+def generate_snapshot(station_location: str, start_date: date, end_date: date, out: str | Path | None = None,
+                      df_weather: pd.DataFrame | None = None, daily: pd.DataFrame | None = None) -> Path:
+    # daily is df_weather's daily rollup; a frame passed without one is rolled up from its own rows
+    if df_weather is None:
+        df_weather = load_weather_frame()
+        daily = load_rollup("daily")
+    if daily is None:
+        daily = build_rollup(df_weather.reset_index(), *ROLLUPS["daily"])
 
-    df_filtered, start_date, end_date = prompt_date_range(df_weather)
+    df_filtered = filter_date_range(df_weather, start_date, end_date)
 
     today = pd.Timestamp(datetime.now().date())
     latest_in_dataset = df_weather.index.max()
@@ -437,14 +406,14 @@ if __name__ == "__main__":
     ytd_start = pd.Timestamp(year=ytd_end.year, month=1, day=1)
     df_ytd = df_weather.loc[ytd_start:ytd_end]
 
-    main_table = build_ytd_summary(df_ytd)
-    aux_table  = build_auxiliary_summary(df_filtered)
-    full_summary_table = build_ytd_summary(df_weather, date_fmt="%d %b %y")
-
-    out_dir = Path('analytics')
-    out_dir.mkdir(parents=True, exist_ok=True)
+    # Rainfall totals & dry spells come from the daily rollup rather than regrouping raw samples
+    main_table = build_ytd_summary(df_ytd, daily=slice_date_range(daily, ytd_start, ytd_end, whole_days=True))
+    aux_table  = build_auxiliary_summary(df_filtered,
+                                         daily=slice_date_range(daily, start_date, end_date, whole_days=True))
+    full_summary_table = build_ytd_summary(df_weather, date_fmt="%d %b %y", daily=daily)
 
-    pdf_path = out_dir / f"{station_location}_snapshot.pdf"
+    pdf_path = Path(out) if out else Path('analytics') / f"{station_location}_snapshot.pdf"
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
 
     save_as_pdf(
         main_tbl=main_table,
@@ -454,5 +423,32 @@ if __name__ == "__main__":
         end=end_date,
         raw_df=df_filtered,
         full_df=full_summary_table,
+        station_location=station_location,
     )
+    return pdf_path
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = report_arguments("Weather snapshot table.", raster=False).parse_args(argv)
+
+    station_location = args.location
+    if station_location is None:
+        try:
+            station_location = get_station_location()
+        except Exception as exception:
+            print(f"{exception}")
+        except KeyboardInterrupt as kbi:
+            print(f"{kbi}")
 
+    df_weather = load_weather_frame()
+
+    if args.start is None or args.end is None:
+        start_date, end_date = prompt_date_range(df_weather)
+    else:
+        start_date, end_date = check_date_range(df_weather, args.start.date(), args.end.date())
+
+    generate_snapshot(station_location, start_date, end_date, args.out, df_weather, load_rollup("daily"))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,8 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
-import matplotlib.image as mpimg
-from helpers.utilities import load_data, copyright_text, get_station_location, contact_details
+from helpers.utilities import (load_data, slice_date_range, get_station_location, report_arguments,
+                               report_date_range, add_logo, add_footer, save_chart)
 from datetime import date, datetime
 
 
@@ -12,128 +12,112 @@ def clear_console():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
-clear_console()
+def load_chart_data():
+    data = load_data()
 
-try:
-    station_location = get_station_location()
-except Exception as exception:
-    print(f"{exception}")
-except KeyboardInterrupt as kbi:
-    print(f"{kbi}")
+    data.columns = [col.strip() for col in data.columns]
+    expected_columns = {'Date (Europe/London)', 'Rain (mm)'}
+    if not expected_columns.issubset(data.columns):
+        raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
-data = load_data()
+    data = data[['Date (Europe/London)', 'Average wind speed (mph)', 'Average wind direction (°)']]
+    return data
 
-data.columns = [col.strip() for col in data.columns]
-expected_columns = {'Date (Europe/London)', 'Rain (mm)'}
-if not expected_columns.issubset(data.columns):
-    raise ValueError(f"Missing expected columns: {expected_columns - set(data.columns)}")
 
-data = data[['Date (Europe/London)', 'Average wind speed (mph)', 'Average wind direction (°)']]
+def generate_report(station_location, start_date, end_date, out=None, data=None, raster=None, rollups=None):
+    if data is None:
+        data = load_chart_data()
 
-data['Date (Europe/London)'] = data['Date (Europe/London)'].astype(str).str.strip()
+    data = slice_date_range(data, start_date, end_date, whole_days=True)
+    if data.empty:
+        print("\n\033[1;93m Warning: No data available for the selected date range.\n"
+              " Use function 1 to check the database date range.\033[0m\n")
 
-data['Date (Europe/London)'] = pd.to_datetime(data['Date (Europe/London)'], format='%Y-%m-%d %H:%M:%S',
-                                              errors='coerce')
+    fig = plt.figure(figsize=(11.69, 8.27))  # A4 landscape size
+    ax = fig.add_subplot(111, polar=True)
 
-data = data.sort_values(by='Date (Europe/London)')
+    bins = np.linspace(0, 360, 9)
+    labels = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']  # Counter-clockwise order
 
-data['Average wind direction (°)'] = (data['Average wind direction (°)'].astype(str).str.replace(',', '', regex=True))
-data['Average wind direction (°)'] = pd.to_numeric(data['Average wind direction (°)'], errors='coerce')
+    data['Wind Direction Group'] = pd.cut(data['Average wind direction (°)'], bins=bins, labels=labels,
+                                          include_lowest=True)
 
-data['Average wind speed (mph)'] = pd.to_numeric(data['Average wind speed (mph)'], errors='coerce')
+    wind_speed_by_direction = data.groupby('Wind Direction Group',
+                                           observed=False)['Average wind speed (mph)'].mean()
 
-# Print data ranges
-print("\n Date range found:")
-print(f"    Start: {data['Date (Europe/London)'].min().strftime('%d/%m/%Y')}")
-print(f"    End:   {data['Date (Europe/London)'].max().strftime('%d/%m/%Y')}")
+    angles = np.linspace(0, 2 * np.pi, len(wind_speed_by_direction), endpoint=False)
 
-def get_user_date_range():
-    while True:
-        try:
-            start_date = input("\n Date to run the report from? (DD-MM-YYYY): ")
-            end_date = input(" Date to run the report until? (DD-MM-YYYY): ")
-
-            start_date = pd.to_datetime(start_date, format='%d-%m-%Y')
-            end_date = pd.to_datetime(end_date, format='%d-%m-%Y')
-
-            if start_date > end_date:
-                print("Start date must be before end date. Try again.")
-                continue
+    ax.bar(angles, wind_speed_by_direction, width=0.4, bottom=0, color='blue', alpha=0.6)
 
-            if start_date < data['Date (Europe/London)'].min() or end_date > data['Date (Europe/London)'].max():
-                print("Date range is outside available data. Try again.")
-                continue
+    ax.set_xticks(angles)
+    ax.set_xticklabels(wind_speed_by_direction.index, fontsize=12)
 
-            return start_date, end_date
-        except ValueError:
-            print("Invalid date format. Please use DD-MM-YYYY.")
+    ax.set_theta_zero_location('N')
+    ax.set_theta_direction(-1)
 
-start_date, end_date = get_user_date_range()
+    ax.set_yticklabels([])
+    ax.grid(False)
 
-data = data[(data['Date (Europe/London)'] >= start_date) & (data['Date (Europe/London)'] <= end_date)]
-if data.empty:
-    print("\n\033[1;93m Warning: No data available for the selected date range.\n"
-          " Use function 1 to check the database date range.\033[0m\n")
+    plt.tight_layout(pad=5.0)
 
-fig = plt.figure(figsize=(11.69, 8.27))  # A4 landscape size
-ax = fig.add_subplot(111, polar=True)
+    # Titles
+    fig.suptitle(f"{station_location} Wind Direction Distribution", fontsize=20, y=0.95)
+    ax.set_title(f"{data['Date (Europe/London)'].min().strftime('%d %B %Y')} - "
+                 f"{data['Date (Europe/London)'].max().strftime('%d %B %Y')}", fontsize=12, loc='center', y=1.05)
 
-bins = np.linspace(0, 360, 9)
-labels = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']  # Counter-clockwise order
+    # Insert logo
+    add_logo(fig, [0.47, 0.06, 0.07, 0.07])
 
-data['Wind Direction Group'] = pd.cut(data['Average wind direction (°)'], bins=bins, labels=labels,
-                                      include_lowest=True)
+    # Author details
+    add_footer(ax, -0.25, -0.27, fontsize=7)
 
-wind_speed_by_direction = data.groupby('Wind Direction Group',
-                                       observed=False)['Average wind speed (mph)'].mean()
+    # Save to PDF with 1 cm margins
+    analytics_path = os.path.join('analytics/')
+    if not os.path.exists(analytics_path):
+        os.makedirs(analytics_path)
 
-angles = np.linspace(0, 2 * np.pi, len(wind_speed_by_direction), endpoint=False)
+    current_date = date.today()
+    current_time = datetime.now()
 
-ax.bar(angles, wind_speed_by_direction, width=0.4, bottom=0, color='blue', alpha=0.6)
+    pdf_filename = out or (f'{analytics_path}{current_date.strftime('%d%m%Y')}_{current_time.strftime('%H:%M')}hrs_'
+                                f'{station_location}_Wind_Distribution_Report.pdf')
 
-ax.set_xticks(angles)
-ax.set_xticklabels(wind_speed_by_direction.index, fontsize=12)
+    os.makedirs(os.path.dirname(pdf_filename) or '.', exist_ok=True)
 
-ax.set_theta_zero_location('N')
-ax.set_theta_direction(-1)
+    with PdfPages(pdf_filename) as pdf:
+        plt.subplots_adjust(left=0.2, right=0.8, top=0.85, bottom=0.2)  # 1 cm margins
+        save_chart(pdf, fig, 'winddistribution', raster)
+        plt.close()
 
-ax.set_yticklabels([])
-ax.grid(False)
+    print(f'\n    Graph created & saved: {pdf_filename}\n')
 
-plt.tight_layout(pad=5.0)
+    return pdf_filename
 
-# Titles
-fig.suptitle(f"{station_location} Wind Direction Distribution", fontsize=20, y=0.95)
-ax.set_title(f"{data['Date (Europe/London)'].min().strftime('%d %B %Y')} - "
-             f"{data['Date (Europe/London)'].max().strftime('%d %B %Y')}", fontsize=12, loc='center', y=1.05)
 
-# Insert logo
-logo = mpimg.imread("helpers/img/logo.jpg")
-logo_ax = fig.add_axes([0.47, 0.06, 0.07, 0.07])  # left, bottom, width, height
-logo_ax.imshow(logo, interpolation="antialiased")
-logo_ax.axis("off")  # Hide axes around the logo
+def main(argv=None):
+    args = report_arguments('Wind direction distribution chart.').parse_args(argv)
+    if args.location is None or args.start is None or args.end is None:
+        clear_console()
 
-# Author details
-ax.text(0.5, -0.25, copyright_text(), transform=ax.transAxes, fontsize=7, color='black',
-        ha='center')
-
-ax.annotate(contact_details(), xy=(0.5, -0.27), ha='center', va='center', fontsize=7,
-             color='blue', xycoords='axes fraction', url=f'mailto:{contact_details()}')
+    station_location = args.location
+    if station_location is None:
+        try:
+            station_location = get_station_location()
+        except Exception as exception:
+            print(f"{exception}")
+        except KeyboardInterrupt as kbi:
+            print(f"{kbi}")
 
-# Save to PDF with 1 cm margins
-analytics_path = os.path.join('analytics/')
-if not os.path.exists(analytics_path):
-    os.makedirs(analytics_path)
+    data = load_chart_data()
 
-current_date = date.today()
-current_time = datetime.now()
+    # Print data ranges
+    print("\n Date range found:")
+    print(f"    Start: {data['Date (Europe/London)'].min().strftime('%d/%m/%Y')}")
+    print(f"    End:   {data['Date (Europe/London)'].max().strftime('%d/%m/%Y')}")
 
-pdf_filename = (f'{analytics_path}{current_date.strftime('%d%m%Y')}_{current_time.strftime('%H:%M')}hrs_'
-                            f'{station_location}_Wind_Distribution_Report.pdf')
+    start_date, end_date = report_date_range(data, args.start, args.end)
+    generate_report(station_location, start_date, end_date, args.out, data, args.raster)
 
-with PdfPages(pdf_filename) as pdf:
-    plt.subplots_adjust(left=0.2, right=0.8, top=0.85, bottom=0.2)  # 1 cm margins
-    pdf.savefig(fig, dpi=300)
-    plt.close()
 
-print(f'\n    Graph created & saved: {pdf_filename}\n')
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import io
+import contextlib
+import unittest
+import numpy as np
+import pandas as pd
+import matplotlib
+
+matplotlib.use('Agg')
+
+from helpers.utilities import chart_series, daily_rain, slice_date_range
+from modules.report_full import batch_windows
+
+
+# Run from the package root: python3 -m unittest discover tests
+
+
+def leap_year_rows():
+    # A year of 5 minute readings for 2024, a leap year, with some rain every day
+    stamps = pd.date_range('2024-01-01', '2024-12-31 23:55', freq='5min')
+    return pd.DataFrame({'Date (Europe/London)': stamps,
+                         'Rain (mm)': np.tile(np.linspace(0, 2, 288), len(stamps) // 288),
+                         'Temperature (°C)': np.sin(np.arange(len(stamps)) / 288.0)})
+
+
+class BatchWindowsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data = leap_year_rows()
+
+    def windows(self, rule):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return batch_windows(rule, self.data)
+
+    def assert_tiles_year(self, windows):
+        # Each window starts the day after the previous one ends, from 1 January to 31 December
+        self.assertEqual(windows[0][0], pd.Timestamp('2024-01-01'))
+        self.assertEqual(windows[-1][1], pd.Timestamp('2024-12-31'))
+        for (_, end_date), (next_start, _) in zip(windows, windows[1:]):
+            self.assertEqual(next_start, end_date + pd.Timedelta(days=1))
+
+        # ...and between them the reports cover every reading & every day exactly once
+        rows = sum(len(slice_date_range(self.data, start_date, end_date, whole_days=True))
+                   for start_date, end_date in windows)
+        self.assertEqual(rows, len(self.data))
+        days = pd.DatetimeIndex(np.concatenate([daily_rain(self.data, start_date, end_date).index
+                                                for start_date, end_date in windows]))
+        self.assertTrue(days.equals(pd.date_range('2024-01-01', '2024-12-31', freq='D')))
+
+    def test_monthly_windows_tile_the_year(self):
+        windows = self.windows('monthly 2024')
+        self.assertEqual(len(windows), 12)
+        self.assert_tiles_year(windows)
+
+        days = [len(daily_rain(self.data, start_date, end_date)) for start_date, end_date in windows]
+        self.assertEqual(days, [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+    def test_quarterly_windows_tile_the_year(self):
+        windows = self.windows('quarterly 2024')
+        self.assertEqual(len(windows), 4)
+        self.assert_tiles_year(windows)
+
+    def test_chart_series_runs_through_the_last_day(self):
+        start_date, end_date = self.windows('monthly 2024')[0]
+        series = chart_series(self.data, ['Temperature (°C)'], start_date, end_date)
+        self.assertEqual(series['Date (Europe/London)'].iloc[0], pd.Timestamp('2024-01-01'))
+        self.assertEqual(series['Date (Europe/London)'].iloc[-1].normalize(), pd.Timestamp('2024-01-31'))
+
+    def test_explicit_windows(self):
+        windows = self.windows('01-01-2024:31-01-2024, 01-02-2024:29-02-2024')
+        self.assertEqual(windows, [(pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-31')),
+                                   (pd.Timestamp('2024-02-01'), pd.Timestamp('2024-02-29'))])
+        self.assertEqual(len(daily_rain(self.data, *windows[0])), 31)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import re
+import tempfile
+import unittest
+import numpy as np
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+
+from helpers.pdfmerge import merge_pdfs, _read_objects, _references
+
+
+# Run from the package root: python3 -m unittest discover tests
+
+LOGO = np.linspace(0, 1, 48 * 48 * 3).reshape(48, 48, 3)
+
+
+def write_chart(path, title, pages=1):
+    # Charts like the report pages: a title, tick labels & the same logo image on every page
+    with PdfPages(path) as pdf:
+        for page in range(pages):
+            fig, ax = plt.subplots()
+            ax.plot(range(10), [value * (page + 1) for value in range(10)])
+            ax.set_title(f'{title} {page + 1}')
+            fig.figimage(LOGO, xo=10, yo=10)
+            pdf.savefig(fig)
+            plt.close(fig)
+
+
+class MergePdfsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+        for title in ('Temperature', 'Rainfall', 'Wind Speed'):
+            self.paths.append(os.path.join(self.directory.name, f'{title}.pdf'))
+            write_chart(self.paths[-1], title)
+        self.out = os.path.join(self.directory.name, 'merged.pdf')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def page_numbers(self, objects, roots):
+        tree = int(re.search(rb'/Pages (\d+) 0 R', objects[roots['Root']]).group(1))
+        count = int(re.search(rb'/Count (\d+)', objects[tree]).group(1))
+        kids = [int(n) for n in re.findall(rb'(\d+) 0 R', re.search(rb'/Kids \[(.*?)\]', objects[tree]).group(1))]
+        self.assertEqual(count, len(kids))
+        return tree, kids
+
+    def assert_structure(self, path, pages):
+        # Every xref offset points at its own object, every reference resolves & the pages are in order
+        pdf = self.read(path)
+        objects, roots = _read_objects(pdf)
+        for number, obj in objects.items():
+            self.assertTrue(obj.startswith(b'%d 0 obj' % number), number)
+            self.assertTrue(obj.rstrip().endswith(b'endobj'), number)
+            for target in _references(obj):
+                self.assertIn(target, objects, f'object {number} refers to missing {target}')
+
+        tree, kids = self.page_numbers(objects, roots)
+        self.assertEqual(len(kids), pages)
+        for kid in kids:
+            self.assertRegex(objects[kid], rb'/Type /Page\b')
+            self.assertIn(b'/Parent %d 0 R' % tree, objects[kid])
+        self.assertIn(b'/Producer', objects[roots['Info']])
+        return objects, kids
+
+    def test_merge_keeps_every_page_in_order(self):
+        self.assertEqual(merge_pdfs(self.paths, self.out), 3)
+        objects, kids = self.assert_structure(self.out, 3)
+
+        # Each page's content is the source page's content, copied unchanged
+        for kid, path in zip(kids, self.paths):
+            source, roots = _read_objects(self.read(path))
+            _, (source_kid,) = self.page_numbers(source, roots)
+            content = re.compile(rb'/Contents (\d+) 0 R')
+            merged_stream = objects[int(content.search(objects[kid]).group(1))].partition(b'\nstream\n')[2]
+            source_stream = source[int(content.search(source[source_kid]).group(1))].partition(b'\nstream\n')[2]
+            self.assertEqual(merged_stream, source_stream)
+
+    def test_shared_objects_written_once(self):
+        merge_pdfs(self.paths, self.out)
+        objects, _ = self.assert_structure(self.out, 3)
+
+        images = [obj for obj in objects.values() if b'/Subtype /Image' in obj]
+        self.assertEqual(len(images), 1)
+
+        # Glyphs drawn on several pages (tick labels), font pieces & lengths: no two objects are the same
+        bodies = [re.sub(rb'^\d+ 0 obj', b'', obj) for obj in objects.values()]
+        self.assertEqual(len(bodies), len(set(bodies)))
+
+        # Close to the same pages saved by a single PdfPages; only each page's small font dictionaries
+        # (one per glyph subset) are repeated
+        serial = os.path.join(self.directory.name, 'serial.pdf')
+        with PdfPages(serial) as pdf:
+            for title in ('Temperature', 'Rainfall', 'Wind Speed'):
+                fig, ax = plt.subplots()
+                ax.plot(range(10), range(10))
+                ax.set_title(f'{title} 1')
+                fig.figimage(LOGO, xo=10, yo=10)
+                pdf.savefig(fig)
+                plt.close(fig)
+        self.assertLess(os.path.getsize(self.out), 1.25 * os.path.getsize(serial))
+
+    def test_merged_file_merges_again(self):
+        merge_pdfs(self.paths, self.out)
+        extra = os.path.join(self.directory.name, 'extra.pdf')
+        write_chart(extra, 'Humidity', pages=2)
+        again = os.path.join(self.directory.name, 'again.pdf')
+
+        self.assertEqual(merge_pdfs([self.out, extra], again), 5)
+        self.assert_structure(again, 5)
+        images = [obj for obj in _read_objects(self.read(again))[0].values() if b'/Subtype /Image' in obj]
+        self.assertEqual(len(images), 1)
+
+    def test_single_file_round_trip(self):
+        self.assertEqual(merge_pdfs(self.paths[:1], self.out), 1)
+        self.assert_structure(self.out, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()